@@ -6,29 +6,152 @@ Runs each player for a specified number of games and reports performance metrics
 
 import argparse
 import logging
+import multiprocessing
+import os
 import time
-from collections import defaultdict
 from datetime import datetime
-from tabulate import tabulate  # You may need to install this: pip install tabulate
+import numpy as np
 
-from .game import Game2048
+from .game import Game2048, play_games_batched, play_games_compiled
 from .board import Board
 from .players import (
-    RandomPlayer, MaxEmptyCellsPlayer, MinMaxPlayer, HeuristicPlayer, HumanPlayer
+    RandomPlayer, MaxEmptyCellsPlayer, MinMaxPlayer, HeuristicPlayer, ExpectimaxPlayer, HumanPlayer
 )
 from .interfaces import GYM2048, CLI2048
 
 logger = logging.getLogger(__name__)
 
+# Tiles shown in the highest tile distribution tables (2 through 2048)
+_TILES = tuple(1 << i for i in range(1, 12))
+_TILE_HEADERS = tuple(str(tile) for tile in _TILES)
+
+# HTML (background, text) colors indexed by tile exponent; 0 is the empty cell and
+# everything above 2048 shares one dark color.
+_HTML_TILE_COLORS = (
+    ('#cdc1b4', '#776e65'),  # Empty cell
+    ('#eee4da', '#776e65'),  # 2
+    ('#ede0c8', '#776e65'),  # 4
+    ('#f2b179', '#f9f6f2'),  # 8
+    ('#f59563', '#f9f6f2'),  # 16
+    ('#f67c5f', '#f9f6f2'),  # 32
+    ('#f65e3b', '#f9f6f2'),  # 64
+    ('#edcf72', '#f9f6f2'),  # 128
+    ('#edcc61', '#f9f6f2'),  # 256
+    ('#edc850', '#f9f6f2'),  # 512
+    ('#edc53f', '#f9f6f2'),  # 1024
+    ('#edc22e', '#f9f6f2'),  # 2048
+) + (('#3c3a32', '#f9f6f2'),) * 4  # 4096 and up
+
+# HTML for every exponent a board nibble can hold
+_HTML_CELLS = tuple(f'''
+            <div class="grid-cell" style="background-color: {bg_color}; color: {text_color}">
+                {1 << exponent if exponent > 0 else ''}
+            </div>''' for exponent, (bg_color, text_color) in enumerate(_HTML_TILE_COLORS))
+
 def get_highest_tile(state):
     """Returns the value of the highest tile on the board."""
-    unpacked_state = Board.get_unpacked_state(state)
-    if not unpacked_state:
-        return 0
-    highest_exponent = max(unpacked_state)
-    return 2 ** highest_exponent if highest_exponent > 0 else 0
+    highest_exponent = Board.get_max_exponent(state)
+    return 1 << highest_exponent if highest_exponent > 0 else 0
+
+def _game_seeds(num_games, seed=None):
+    """
+    Return one SeedSequence per game.
+
+    With a base seed the per-game seeds are fixed, so a run replays the same games no
+    matter how they are split across workers; without one they are drawn at random.
+    Either way they are spawned from one SeedSequence, so no two games share a seed
+    and runs with nearby base seeds share no games.
+    """
+    return np.random.SeedSequence(seed).spawn(num_games)
+
+# Chunks of games queued per worker process and player
+_CHUNKS_PER_WORKER = 4
+
+def _play_sequential(game, seeds):
+    """Yield (score, state, move_count) for one game per seed, played one after another."""
+    for seed in seeds:
+        yield game.play_game_fast(seed=seed)
+
+def _run_chunk(player_cls, seeds, optimize, player_kwargs):
+    """
+    Play a chunk of games in a worker process, one per seed, with a player_cls(**player_kwargs).
+
+    Returns:
+        Tuple of the seconds the chunk took and its list of (score, state, move_count) tuples
+    """
+    start_time = time.time()
+    if optimize:
+        Board.disable_verifiers()
+    game = Game2048(player=player_cls(**player_kwargs))
+    games = list(_play_sequential(game, seeds))
+    return time.time() - start_time, games
+
+def _submit_parallel(pool, player_cls, seeds, workers, optimize, player_kwargs):
+    """
+    Queue one player's games on the pool, one task per chunk of seeds.
+
+    Each worker gets several small chunks, so workers that finish one player early pick
+    up the next player's games instead of idling through the slowest chunk.
+
+    Returns:
+        List of AsyncResults for the chunks, in seed order
+    """
+    num_chunks = min(workers * _CHUNKS_PER_WORKER, len(seeds))
+    chunk_size, extra = divmod(len(seeds), num_chunks)
+    pending = []
+    start = 0
+    for i in range(num_chunks):
+        end = start + chunk_size + (i < extra)
+        pending.append(pool.apply_async(_run_chunk, (player_cls, seeds[start:end], optimize, player_kwargs)))
+        start = end
+    return pending
+
+def _tick_interface(games, interface):
+    """Yield (score, state, move_count) games unchanged, telling the interface each one finished."""
+    for score, state, move_count in games:
+        interface.game_finished(state, move_count, score)
+        yield score, state, move_count
+
+def _play_parallel(pending, chunk_times, interface=None):
+    """
+    Yield (score, state, move_count) for every game of the pending chunks, in seed order.
+
+    Workers play headless; the parent ticks the interface for every game as each chunk
+    comes back, so progress reporting never crosses a process boundary. The worker time
+    of each chunk is appended to chunk_times.
+    """
+    for result in pending:
+        elapsed, chunk = result.get()
+        chunk_times.append(elapsed)
+        yield from _tick_interface(chunk, interface) if interface else chunk
 
-def run_benchmark(num_games, players, optimize=False, show_progress=True):
+def play_parallel(player_cls, num_games, workers, optimize=False, interface=None, seed=None, player_kwargs=None):
+    """
+    Yield (score, state, move_count) for num_games games played on a pool of worker processes.
+
+    Args:
+        player_cls: Player class each worker instantiates
+        num_games: Number of games to play
+        workers: Number of worker processes (0: one per CPU)
+        optimize: Whether workers disable board verifiers
+        interface: Optional interface ticked by the parent for every finished game
+        seed: Base seed that makes the games reproducible, or None for random games
+        player_kwargs: Keyword arguments each worker passes to player_cls
+
+    Raises:
+        ValueError: If num_games is less than 1
+    """
+    if num_games < 1:
+        raise ValueError(f"num_games must be at least 1, got {num_games}")
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    with multiprocessing.Pool(workers) as pool:
+        pending = _submit_parallel(pool, player_cls, _game_seeds(num_games, seed), workers, optimize,
+                                   player_kwargs or {})
+        yield from _play_parallel(pending, [], interface)
+
+def run_benchmark(num_games, players, optimize=False, show_progress=True, batched=False, workers=1, seed=None,
+                  compiled=False, player_kwargs=None):
     """
     Run benchmark with specified players for the given number of games.
     
@@ -37,14 +160,31 @@ def run_benchmark(num_games, players, optimize=False, show_progress=True):
         players: List of player classes to benchmark
         optimize: Whether to enable board optimization
         show_progress: Whether to show progress during benchmarking
+        batched: Whether to play all games of batch-capable players side by side
+        workers: Number of worker processes to spread the games over (0: one per CPU); with
+            more than one, the games of all players are queued on one shared pool up front
+            and time per game is measured as worker time
+        seed: Base seed that makes the benchmark reproducible, or None for random games
+        compiled: Whether to play the games of players with a compiled move policy
+            entirely in numba-compiled code
+        player_kwargs: Constructor keyword arguments per player class, for the players
+            that take any (see get_player_kwargs)
         
     Returns:
         Dictionary with benchmark results
+
+    Raises:
+        ValueError: If num_games is less than 1
     """
+    if num_games < 1:
+        raise ValueError(f"num_games must be at least 1, got {num_games}")
     results = {}
+    player_kwargs = player_kwargs or {}
+    if workers == 0:
+        workers = os.cpu_count() or 1
     
     # Set up GYM interface for progress tracking
-    interface = GYM2048()
+    interface = GYM2048(enabled=show_progress)
     total_games = len(players) * num_games
     interface.set_total_games(total_games)
     
@@ -53,53 +193,87 @@ def run_benchmark(num_games, players, optimize=False, show_progress=True):
         Board.disable_verifiers()
         verifiers_disabled = True
     
+    pool = None
+    pending = {}
     try:
+        if workers > 1:
+            # Queue every player that plays in Python on one pool, so no worker idles
+            # while a slow player's last chunks finish
+            parallel_players = [
+                player_cls for player_cls in players
+                if not (compiled and player_cls.compiled_policy is not None)
+                and not (batched and player_cls.supports_batch)
+            ]
+            if parallel_players:
+                pool = multiprocessing.Pool(workers)
+                for player_cls in parallel_players:
+                    pending[player_cls] = _submit_parallel(
+                        pool, player_cls, _game_seeds(num_games, seed), workers, optimize,
+                        player_kwargs.get(player_cls, {}))
+
         for player_cls in players:
             player_name = player_cls.__name__.replace("Player", "")
-            logger.info(f"Benchmarking {player_name} for {num_games} games...")
+            logger.info("Benchmarking %s for %d games...", player_name, num_games)
             
-            game = Game2048(player=player_cls(), interface=interface)
-            scores = []
-            highest_tiles = []
-            move_counts = []
-            best_score = 0
-            best_state = None
-            best_moves = 0
+            player = player_cls(**player_kwargs.get(player_cls, {}))
+            # 17 bytes per game; scores and move counts stay far below 2**31
+            scores = np.zeros(num_games, dtype=np.int32)
+            highest_exponents = np.zeros(num_games, dtype=np.int8)
+            move_counts = np.zeros(num_games, dtype=np.int32)
+            final_states = np.zeros(num_games, dtype=np.uint64)
             
             # Track time for this player
             start_time = time.time()
+            chunk_times = None
             
-            for _ in range(num_games):
-                score, state, move_count = game.play_game()
-                scores.append(score)
-                highest_tiles.append(get_highest_tile(state))
-                move_counts.append(move_count)
-                
-                if score > best_score:
-                    best_score = score
-                    best_state = state
-                    best_moves = move_count
-                game.reset()
+            if compiled and player.compiled_policy is not None:
+                # numba's generator takes 32-bit integer seeds
+                jit_seeds = [game_seed.generate_state(1)[0] for game_seed in _game_seeds(num_games, seed)]
+                jit_scores, jit_states, jit_moves = play_games_compiled(player, jit_seeds)
+                games = _tick_interface(zip(jit_scores.tolist(), jit_states.tolist(), jit_moves.tolist()), interface)
+            elif batched and player.supports_batch:
+                rng = np.random.default_rng(seed) if seed is not None else None
+                batch_scores, batch_states, batch_moves = play_games_batched(player, num_games, rng)
+                games = _tick_interface(zip(batch_scores.tolist(), batch_states.tolist(), batch_moves.tolist()),
+                                        interface)
+            elif player_cls in pending:
+                chunk_times = []
+                games = _play_parallel(pending.pop(player_cls), chunk_times, interface)
+            else:
+                game = Game2048(player=player, interface=interface)
+                games = _play_sequential(game, _game_seeds(num_games, seed))
+
+            for i, (score, state, move_count) in enumerate(games):
+                scores[i] = score
+                highest_exponents[i] = Board.get_max_exponent(state)
+                move_counts[i] = move_count
+                final_states[i] = state
             
             # Calculate time statistics
             total_time = time.time() - start_time
+            if chunk_times is not None:
+                # Other players' games overlap this player's, so count worker time
+                total_time = sum(chunk_times)
             time_per_game = total_time / num_games
             
+            # Games per highest tile, indexed by the tile's exponent (index 0: empty board)
+            highest_tile_counts = np.bincount(highest_exponents, minlength=16)
+
+            # argmax picks the first of equally good games, like a running strict max
+            best = int(scores.argmax())
+
             # Store results
             results[player_name] = {
-                "avg_score": sum(scores) / num_games,
-                "max_score": best_score,
-                "best_state": best_state,
-                "best_moves": best_moves,
-                "avg_moves": sum(move_counts) / num_games,
-                "highest_tile_counts": defaultdict(int),
+                "num_games": num_games,
+                "avg_score": float(scores.mean()),
+                "max_score": int(scores[best]),
+                "best_state": int(final_states[best]),
+                "best_moves": int(move_counts[best]),
+                "avg_moves": float(move_counts.mean()),
+                "highest_tile_counts": highest_tile_counts,
                 "time_per_game": time_per_game,
                 "total_time": total_time
             }
-            
-            # Count tile frequencies
-            for tile in highest_tiles:
-                results[player_name]["highest_tile_counts"][tile] += 1
         
         # Add newline after progress updates
         if show_progress:
@@ -107,11 +281,54 @@ def run_benchmark(num_games, players, optimize=False, show_progress=True):
             
         return results
     finally:
+        if pool is not None:
+            pool.terminate()
         # Re-enable verifiers if they were disabled
         if verifiers_disabled:
             Board.enable_verifiers()
             logger.debug("Board verifiers re-enabled after benchmarking")
 
+def _tile_distribution_cells(data):
+    """Return the "count (percent%)" cell for every tile in _TILES, for one player's results."""
+    total_games = data["num_games"]
+    cells = []
+    # _TILES covers exponents 1..11
+    for count in data["highest_tile_counts"][1:len(_TILES) + 1].tolist():
+        percentage = (count / total_games) * 100 if total_games > 0 else 0
+        cells.append(f"{count} ({percentage:.1f}%)")
+    return cells
+
+def _is_number(cell):
+    try:
+        float(cell)
+    except ValueError:
+        return False
+    return True
+
+def _grid(rows, headers):
+    """
+    Render rows as a plain-text grid table with a header row. Columns whose cells are
+    all numbers are right-aligned, the others left-aligned.
+    """
+    columns = list(zip(headers, *rows))
+    widths = [max(len(str(cell)) for cell in column) for column in columns]
+    right_aligned = [all(_is_number(cell) for cell in column[1:]) for column in columns]
+
+    def line(fill):
+        return '+' + '+'.join(fill * (width + 2) for width in widths) + '+'
+
+    def row_line(row):
+        cells = [str(cell).rjust(width) if right else str(cell).ljust(width)
+                 for cell, width, right in zip(row, widths, right_aligned)]
+        return '| ' + ' | '.join(cells) + ' |'
+
+    separator = line('-')
+    lines = [separator, row_line(headers), line('=')]
+    for row in rows:
+        lines.append(row_line(row))
+        lines.append(separator)
+    return '\n'.join(lines)
+
 def generate_report(results):
     """Generate a formatted report from benchmark results."""
     # Basic performance table
@@ -119,7 +336,7 @@ def generate_report(results):
     headers = ["Player", "Games", "Avg Score", "Max Score", "Avg Moves", "Time/Game (s)"]
     
     for player, data in results.items():
-        total_games = sum(data["highest_tile_counts"].values())
+        total_games = data["num_games"]
         performance_table.append([
             player,
             total_games,
@@ -130,199 +347,139 @@ def generate_report(results):
         ])
     
     # Highest tile distribution table
-    tile_headers = ["Player"] + [str(2**i) for i in range(1, 12)]  # Just the tile values
+    tile_headers = ["Player", *_TILE_HEADERS]
     tile_table = []
     
     for player, data in results.items():
-        row = [player]
-        counts = data["highest_tile_counts"]
-        total_games = sum(counts.values())
-        
-        for i in range(1, 12):
-            tile = 2**i
-            count = counts.get(tile, 0)
-            percentage = (count / total_games) * 100 if total_games > 0 else 0
-            row.append(f"{count} ({percentage:.1f}%)")
-        
-        tile_table.append(row)
+        tile_table.append([player, *_tile_distribution_cells(data)])
     
     # Generate the report
-    report = "\n\n"
-    report += "=" * 80 + "\n"
-    report += f"BENCHMARK RESULTS ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n"
-    report += "=" * 80 + "\n\n"
-    
-    report += "PERFORMANCE METRICS:\n"
-    report += tabulate(performance_table, headers=headers, tablefmt="grid") + "\n\n"
-    
-    report += "HIGHEST TILE DISTRIBUTION:\n"
-    report += tabulate(tile_table, headers=tile_headers, tablefmt="grid") + "\n\n"
-    
-    # Add best game visualizations
-    report += "BEST GAMES:\n"
+    parts = [
+        "\n\n",
+        "=" * 80 + "\n",
+        f"BENCHMARK RESULTS ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n",
+        "=" * 80 + "\n\n",
+        "PERFORMANCE METRICS:\n",
+        _grid(performance_table, headers) + "\n\n",
+        "HIGHEST TILE DISTRIBUTION:\n",
+        _grid(tile_table, tile_headers) + "\n\n",
+        # Add best game visualizations
+        "BEST GAMES:\n",
+    ]
     for player, data in results.items():
-        report += f"\n{player} (Score: {data['max_score']}, Moves: {data['best_moves']}):\n"
-        import io
-        import sys
-        
-        original_stdout = sys.stdout
-        string_buffer = io.StringIO()
-        sys.stdout = string_buffer
-        
-        CLI2048.pretty_print(data['best_state'], data['max_score'], data['best_moves'])
-        
-        board_string = string_buffer.getvalue()
-        sys.stdout = original_stdout
-        
-        report += board_string + "\n"
+        parts.append(f"\n{player} (Score: {data['max_score']}, Moves: {data['best_moves']}):\n")
+        parts.append(CLI2048.pretty_format(data['best_state'], data['max_score'], data['best_moves']))
+        parts.append("\n\n")
     
-    return report
+    return "".join(parts)
 
 def generate_html_board(state, score, moves):
     """Generate an HTML representation of a 2048 game board."""
-    # 2048 game colors for each tile value
-    tile_colors = {
-        0: ('#cdc1b4', '#776e65'),     # Empty cell
-        2: ('#eee4da', '#776e65'),     # 2
-        4: ('#ede0c8', '#776e65'),     # 4
-        8: ('#f2b179', '#f9f6f2'),     # 8
-        16: ('#f59563', '#f9f6f2'),    # 16
-        32: ('#f67c5f', '#f9f6f2'),    # 32
-        64: ('#f65e3b', '#f9f6f2'),    # 64
-        128: ('#edcf72', '#f9f6f2'),   # 128
-        256: ('#edcc61', '#f9f6f2'),   # 256
-        512: ('#edc850', '#f9f6f2'),   # 512
-        1024: ('#edc53f', '#f9f6f2'),  # 1024
-        2048: ('#edc22e', '#f9f6f2'),  # 2048
-    }
-
-    # Get the unpacked state
     unpacked_state = Board.get_unpacked_state(state)
-    board = []
-    for i in range(0, 16, 4):
-        row = []
-        for j in range(4):
-            value = 2 ** unpacked_state[i + j] if unpacked_state[i + j] > 0 else 0
-            bg_color, text_color = tile_colors.get(value, ('#3c3a32', '#f9f6f2'))  # Default for higher values
-            row.append((value, bg_color, text_color))
-        board.append(row)
-
-    html = f"""
+    parts = [f"""
     <div class="game-container">
         <div class="game-info">
             <div class="score-box">Score: {score}</div>
             <div class="moves-box">Moves: {moves}</div>
         </div>
-        <div class="grid-container">"""
+        <div class="grid-container">"""]
     
-    for row in board:
-        html += '<div class="grid-row">'
-        for value, bg_color, text_color in row:
-            text = str(value) if value > 0 else ''
-            html += f'''
-            <div class="grid-cell" style="background-color: {bg_color}; color: {text_color}">
-                {text}
-            </div>'''
-        html += '</div>'
+    for i in range(0, 16, 4):
+        parts.append('<div class="grid-row">')
+        parts.extend([_HTML_CELLS[exponent] for exponent in unpacked_state[i:i + 4]])
+        parts.append('</div>')
     
-    html += """
+    parts.append("""
         </div>
-    </div>"""
+    </div>""")
     
-    return html
+    return "".join(parts)
 
-def generate_html_report(results):
-    """Generate an HTML formatted report from benchmark results."""
-    current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>2048 Benchmark Results</title>
-    <style>
-        body {{ 
+# Static parts of the HTML report; filled in with str.format_map, so the CSS needs no
+# brace escaping.
+_HTML_REPORT_CSS = """        body { 
             font-family: Arial, sans-serif; 
             margin: 20px; 
             background-color: #ffffff;
             color: #333333;
             line-height: 1.6;
-        }}
-        table {{ 
+        }
+        table { 
             border-collapse: collapse; 
             margin: 20px 0; 
             width: 100%; 
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        th, td {{ 
+        }
+        th, td { 
             border: 1px solid #e0e0e0; 
             padding: 12px; 
             text-align: left; 
-        }}
-        th {{ 
+        }
+        th { 
             background-color: #f5f5f5; 
             font-weight: bold;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background-color: #fafafa;
-        }}
-        .section {{ 
+        }
+        .section { 
             margin: 40px 0;
             padding: 20px;
             background-color: #ffffff;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1, h2, h3 {{ 
+        }
+        h1, h2, h3 { 
             color: #333333;
             margin-top: 0;
-        }}
-        h1 {{
+        }
+        h1 {
             border-bottom: 2px solid #bbada0;
             padding-bottom: 10px;
-        }}
-        .player-best {{
+        }
+        .player-best {
             background-color: #ffffff;
             padding: 20px;
             border-radius: 8px;
             margin: 15px 0;
             border: 1px solid #e0e0e0;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #666666;
             font-style: italic;
-        }}
-        .game-container {{
+        }
+        .game-container {
             width: 400px;
             margin: 20px auto;
-        }}
-        .game-info {{
+        }
+        .game-info {
             display: flex;
             justify-content: space-between;
             margin-bottom: 10px;
-        }}
-        .score-box, .moves-box {{
+        }
+        .score-box, .moves-box {
             background: #bbada0;
             padding: 10px 20px;
             border-radius: 3px;
             color: white;
             font-weight: bold;
-        }}
-        .grid-container {{
+        }
+        .grid-container {
             background: #bbada0;
             padding: 15px;
             border-radius: 6px;
             width: 100%;
             box-sizing: border-box;
-        }}
-        .grid-row {{
+        }
+        .grid-row {
             display: flex;
             gap: 15px;
             margin-bottom: 15px;
-        }}
-        .grid-row:last-child {{
+        }
+        .grid-row:last-child {
             margin-bottom: 0;
-        }}
-        .grid-cell {{
+        }
+        .grid-cell {
             width: 80px;
             height: 80px;
             border-radius: 3px;
@@ -332,12 +489,19 @@ def generate_html_report(results):
             font-size: 24px;
             font-weight: bold;
             transition: background-color 0.15s ease;
-        }}
-    </style>
+        }
+"""
+
+_HTML_REPORT_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>2048 Benchmark Results</title>
+    <style>
+{css}    </style>
 </head>
 <body>
     <h1>2048 Benchmark Results</h1>
-    <p class="timestamp">Generated on: {current_date}</p>
+    <p class="timestamp">Generated on: {date}</p>
     
     <div class="section">
         <h2>Performance Metrics</h2>
@@ -351,20 +515,7 @@ def generate_html_report(results):
                 <th>Time/Game (s)</th>
             </tr>"""
 
-    # Add performance data
-    for player, data in results.items():
-        total_games = sum(data["highest_tile_counts"].values())
-        html += f"""
-            <tr>
-                <td>{player}</td>
-                <td>{total_games}</td>
-                <td>{data['avg_score']:.1f}</td>
-                <td>{data['max_score']}</td>
-                <td>{data['avg_moves']:.1f}</td>
-                <td>{data['time_per_game']:.3f}</td>
-            </tr>"""
-
-    html += """
+_HTML_TILE_SECTION_START = """
         </table>
     </div>
     
@@ -372,49 +523,60 @@ def generate_html_report(results):
         <h2>Highest Tile Distribution</h2>
         <table>
             <tr>
-                <th>Player</th>"""
+                <th>Player</th>""" + "".join(f"<th>{header}</th>" for header in _TILE_HEADERS) + "</tr>"
 
-    # Add simplified tile headers
-    for i in range(1, 12):
-        html += f"<th>{2**i}</th>"
-    html += "</tr>"
-
-    # Add tile distribution data
-    for player, data in results.items():
-        html += f"<tr><td>{player}</td>"
-        counts = data["highest_tile_counts"]
-        total_games = sum(counts.values())
-        
-        for i in range(1, 12):
-            tile = 2**i
-            count = counts.get(tile, 0)
-            percentage = (count / total_games) * 100 if total_games > 0 else 0
-            html += f"<td>{count} ({percentage:.1f}%)</td>"
-        html += "</tr>"
-
-    html += """
+_HTML_BEST_GAMES_SECTION_START = """
         </table>
     </div>
     
     <div class="section">
         <h2>Best Games</h2>"""
 
-    # Add best games
-    for player, data in results.items():
-        html += f"""
-        <div class="player-best">
-            <h3>{player}</h3>"""
-        
-        # Generate HTML board directly
-        html += generate_html_board(data['best_state'], data['max_score'], data['best_moves'])
-        html += "</div>"
-
-    html += """
+_HTML_REPORT_FOOTER = """
     </div>
 </body>
 </html>
 """
-    return html
+
+_HTML_PERFORMANCE_ROW = """
+            <tr>
+                <td>{player}</td>
+                <td>{total_games}</td>
+                <td>{avg_score:.1f}</td>
+                <td>{max_score}</td>
+                <td>{avg_moves:.1f}</td>
+                <td>{time_per_game:.3f}</td>
+            </tr>"""
+
+def stream_html_report(results):
+    """Yield an HTML formatted report from benchmark results in chunks, for writing straight to a file."""
+    current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Build every player's rows in one pass over the results, then splice them into the page
+    performance_rows = []
+    tile_rows = []
+    best_games = []
+    for player, data in results.items():
+        performance_rows.append(
+            _HTML_PERFORMANCE_ROW.format_map({"player": player, "total_games": data["num_games"], **data})
+        )
+        tile_cells = "".join(f"<td>{cell}</td>" for cell in _tile_distribution_cells(data))
+        tile_rows.append(f"<tr><td>{player}</td>{tile_cells}</tr>")
+        best_games.append(f"""
+        <div class="player-best">
+            <h3>{player}</h3>{generate_html_board(data['best_state'], data['max_score'], data['best_moves'])}</div>""")
+
+    yield _HTML_REPORT_HEADER.format_map({"date": current_date, "css": _HTML_REPORT_CSS})
+    yield from performance_rows
+    yield _HTML_TILE_SECTION_START
+    yield from tile_rows
+    yield _HTML_BEST_GAMES_SECTION_START
+    yield from best_games
+    yield _HTML_REPORT_FOOTER
+
+def generate_html_report(results):
+    """Generate an HTML formatted report from benchmark results."""
+    return "".join(stream_html_report(results))
 
 def add_arguments(parser):
     """Add benchmark-specific arguments to the argument parser."""
@@ -424,6 +586,15 @@ def add_arguments(parser):
                       help="Specific players to benchmark")
     parser.add_argument("--optimize", action="store_true",
                       help="Enable board optimizations")
+    parser.add_argument("--batch", action="store_true",
+                      help="Play games of batch-capable players (random, maxemptycells, heuristic) side by side")
+    parser.add_argument("--jit", action="store_true",
+                      help="Play whole games of random, maxemptycells and minmax in compiled code")
+    parser.add_argument("--workers", type=int, default=1,
+                      help="Number of worker processes shared by all players, 0 for one per CPU (default: 1)")
+    parser.add_argument("--seed", type=int,
+                      help="Base seed for reproducible games (same results for any --workers)")
+    add_player_arguments(parser)
     parser.add_argument("-o", "--output", type=str,
                       help="Output file for benchmark results")
     parser.add_argument("--format", type=str, choices=["text", "html"], default="text",
@@ -431,6 +602,25 @@ def add_arguments(parser):
     parser.add_argument("-v", "--verbose", action="store_true",
                       help="Enable debug logging")
 
+def add_player_arguments(parser):
+    """Add the options that configure search players; shared by the play and benchmark commands."""
+    parser.add_argument("--depth", type=int,
+                      help="Expectimax search depth in plies (default: 2)")
+    parser.add_argument("--time-limit", type=float,
+                      help="Expectimax seconds per move; deepens one ply at a time up to --depth")
+
+def get_player_kwargs(args):
+    """
+    Return the constructor keyword arguments per player class for the player options
+    given on the command line (see add_player_arguments).
+    """
+    expectimax_kwargs = {}
+    if args.depth is not None:
+        expectimax_kwargs["depth"] = args.depth
+    if args.time_limit is not None:
+        expectimax_kwargs["time_limit"] = args.time_limit
+    return {ExpectimaxPlayer: expectimax_kwargs}
+
 def handle_benchmark_command(args):
     """Handle the benchmark command from main.py."""
     # Configure logging
@@ -442,24 +632,26 @@ def handle_benchmark_command(args):
         # Get players to benchmark
         players_to_benchmark = get_available_players(args.players)
         
-        logger.info(f"Starting benchmark with {len(players_to_benchmark)} players for {args.num_games} games each")
+        logger.info("Starting benchmark with %d players for %d games each", len(players_to_benchmark), args.num_games)
         
         # Run the benchmark
         results = run_benchmark(
             num_games=args.num_games,
             players=players_to_benchmark,
             optimize=args.optimize,
-            show_progress=True
+            show_progress=True,
+            batched=args.batch,
+            workers=args.workers,
+            seed=args.seed,
+            compiled=args.jit,
+            player_kwargs=get_player_kwargs(args)
         )
         
-        # Generate report in requested format
+        # Generate report in requested format; HTML is only streamed to the output file
         if args.format == "html":
-            report = generate_html_report(results)
+            report = stream_html_report(results)
         else:
             report = generate_report(results)
-        
-        # Display report if not HTML
-        if args.format == "text":
             print(report)
         
         # Save report to file if requested
@@ -499,6 +691,7 @@ def get_available_players(specified_players=None, include_human=False):
         MaxEmptyCellsPlayer,
         MinMaxPlayer,
         HeuristicPlayer,
+        ExpectimaxPlayer,
     )
     
     # Define available players
@@ -509,6 +702,7 @@ def get_available_players(specified_players=None, include_human=False):
             MaxEmptyCellsPlayer,
             MinMaxPlayer,
             HeuristicPlayer,
+            ExpectimaxPlayer,
         ]
     }
     
@@ -537,13 +731,16 @@ def save_report(report, output_file, format="text"):
     Save benchmark report to a file.
     
     Args:
-        report: The report content (text or HTML)
+        report: The report content (text or HTML), as one string or an iterable of chunks
         output_file: Path to save the report to
         format: Output format ("text" or "html")
     """
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report)
-    logger.info(f"Benchmark results saved to {output_file}")
+        if isinstance(report, str):
+            f.write(report)
+        else:
+            f.writelines(report)
+    logger.info("Benchmark results saved to %s", output_file)
     if format == "html":
         logger.info("Open the HTML file in a web browser to view the report")
 
@@ -1,21 +1,213 @@
-from enum import Enum
+from enum import IntEnum
 from typing import Dict
 
+import numpy as np
+from numba import njit
 
-class Action(Enum):
+
+class Action(IntEnum):
     LEFT = 0
     RIGHT = 1
     UP = 2
     DOWN = 3
 
 
+# Action members indexed by value, so hot paths skip the Action(value) lookup.
+_ACTIONS = tuple(Action)
+
+
+_ROW_MASK = np.uint64(0xFFFF)
+_NIBBLE_MASK = np.uint64(0xF)
+_NIBBLE_SHIFTS = np.arange(0, 64, 4, dtype=np.uint64)
+
+# Decode one byte of an empty-tile mask (see Board.get_empty_mask) into flat indices or
+# (row, col) positions, so a 16-bit mask takes two lookups instead of a 16-step scan.
+_EMPTY_INDICES_LOW = tuple(tuple(i for i in range(8) if (byte >> i) & 1) for byte in range(256))
+_EMPTY_INDICES_HIGH = tuple(tuple(i + 8 for i in range(8) if (byte >> i) & 1) for byte in range(256))
+_EMPTY_TILES_HIGH = tuple(
+    tuple((3 - i // 4, 3 - i % 4) for i in range(15, 7, -1) if (byte >> (i - 8)) & 1) for byte in range(256)
+)
+_EMPTY_TILES_LOW = tuple(
+    tuple((3 - i // 4, 3 - i % 4) for i in range(7, -1, -1) if (byte >> i) & 1) for byte in range(256)
+)
+# The two tile exponents packed in one byte of the board, high nibble first.
+_UNPACKED_BYTES = tuple((byte >> 4, byte & 0xF) for byte in range(256))
+
+
+@njit("uint64(uint64)", cache=True)
+def _reverse_row(row):
+    """Reverse the order of the four tiles in a 16-bit row."""
+    return ((row & 0xF) << 12) | ((row & 0xF0) << 4) | ((row >> 4) & 0xF0) | (row >> 12)
+
+
+@njit("void(uint32[:], uint32[:], uint32[:], uint32[:])", cache=True)
+def _fill_row_tables(left_moves, right_moves, left_scores, right_scores):
+    """Fill the LEFT/RIGHT move and score tables for every 16-bit row."""
+    tiles = np.empty(4, dtype=np.uint64)
+    for row in range(1 << 16):
+        # Squeeze out empty tiles, leftmost (high nibble) first.
+        count = 0
+        for i in range(4):
+            tile = np.uint64((row >> (12 - 4 * i)) & 0xF)
+            if tile:
+                tiles[count] = tile
+                count += 1
+        # Merge equal neighbours once, left to right; 15 is the largest tile and never merges.
+        new_row = np.uint64(0)
+        score = np.uint64(0)
+        i = out = 0
+        while i < count:
+            tile = tiles[i]
+            if i + 1 < count and tiles[i + 1] == tile and tile != 15:
+                tile += np.uint64(1)
+                score += np.uint64(1) << tile
+                i += 2
+            else:
+                i += 1
+            new_row |= tile << np.uint64(12 - 4 * out)
+            out += 1
+        left_moves[row] = new_row
+        left_scores[row] = score
+
+    # A RIGHT move is a LEFT move on the reversed row.
+    for row in range(1 << 16):
+        reversed_row = _reverse_row(np.uint64(row))
+        right_moves[row] = _reverse_row(np.uint64(left_moves[reversed_row]))
+        right_scores[row] = left_scores[reversed_row]
+
+
+@njit("void(uint32[:], uint8[:])", cache=True)
+def _fill_row_stat_tables(row_sums, row_maxes):
+    """Fill the tile-value sum (sum of 2**tile over non-empty tiles) and the largest
+    exponent for every 16-bit row."""
+    for row in range(1 << 16):
+        total = 0
+        largest = 0
+        for i in range(4):
+            tile = (row >> (4 * i)) & 0xF
+            if tile:
+                total += 1 << tile
+            largest = max(largest, tile)
+        row_sums[row] = total
+        row_maxes[row] = largest
+
+
+# Kernels on the packed uint64 board. The ones other modules' compiled code calls (the
+# game loop and the expectimax search) have public *_packed names; the rest are private.
+
+
+@njit("uint64(uint64)", cache=True)
+def transpose_packed(state):
+    """Transpose the 4x4 board (rows become columns) using SWAR nibble swaps."""
+    # Swap the 4-bit cells that sit one step off the diagonal inside each 2x2 block.
+    a1 = state & np.uint64(0xF0F00F0FF0F00F0F)
+    a2 = state & np.uint64(0x0000F0F00000F0F0)
+    a3 = state & np.uint64(0x0F0F00000F0F0000)
+    a = a1 | (a2 << np.uint64(12)) | (a3 >> np.uint64(12))
+    # Swap the off-diagonal 2x2 blocks.
+    b1 = a & np.uint64(0xFF00FF0000FF00FF)
+    b2 = a & np.uint64(0x00FF00FF00000000)
+    b3 = a & np.uint64(0x00000000FF00FF00)
+    return b1 | (b2 >> np.uint64(24)) | (b3 << np.uint64(24))
+
+
+@njit("uint64(uint64)", cache=True)
+def _mirror(state):
+    """Reverse the cells of every row (left-right reflection)."""
+    swapped = (((state & np.uint64(0xF0F0F0F0F0F0F0F0)) >> np.uint64(4))
+               | ((state & np.uint64(0x0F0F0F0F0F0F0F0F)) << np.uint64(4)))
+    return (((swapped & np.uint64(0xFF00FF00FF00FF00)) >> np.uint64(8))
+            | ((swapped & np.uint64(0x00FF00FF00FF00FF)) << np.uint64(8)))
+
+
+@njit("uint64(uint64)", cache=True)
+def _flip(state):
+    """Reverse the order of the rows (up-down reflection)."""
+    swapped = (((state & np.uint64(0xFFFF0000FFFF0000)) >> np.uint64(16))
+               | ((state & np.uint64(0x0000FFFF0000FFFF)) << np.uint64(16)))
+    return (swapped >> np.uint64(32)) | (swapped << np.uint64(32))
+
+
+@njit("uint64(uint64)", cache=True)
+def canonical_packed(state):
+    """Smallest of the board's eight rotations and reflections."""
+    best = state
+    for board in (state, transpose_packed(state)):
+        mirrored = _mirror(board)
+        best = min(best, board, mirrored, _flip(board), _flip(mirrored))
+    return best
+
+
+# Rows of the packed (4, 65536) row table, see Board.__row_tables.
+_LEFT_MOVES, _RIGHT_MOVES, _LEFT_SCORES, _RIGHT_SCORES = range(4)
+_SHIFT_16 = np.uint64(16)
+_SHIFT_32 = np.uint64(32)
+_SHIFT_48 = np.uint64(48)
+
+
+@njit("uint64(uint64, uint32[:, ::1], int64)", cache=True)
+def _move_rows(state, tables, table):
+    """Look up all four rows of a packed board in one move table (unrolled)."""
+    return (np.uint64(tables[table, state & _ROW_MASK])
+            | np.uint64(tables[table, (state >> _SHIFT_16) & _ROW_MASK]) << _SHIFT_16
+            | np.uint64(tables[table, (state >> _SHIFT_32) & _ROW_MASK]) << _SHIFT_32
+            | np.uint64(tables[table, state >> _SHIFT_48]) << _SHIFT_48)
+
+
+@njit("uint64(uint64, uint32[:, ::1], int64)", cache=True)
+def _score_rows(state, tables, table):
+    """Sum the move score of all four rows of a packed board (unrolled)."""
+    return (np.uint64(tables[table, state & _ROW_MASK])
+            + np.uint64(tables[table, (state >> _SHIFT_16) & _ROW_MASK])
+            + np.uint64(tables[table, (state >> _SHIFT_32) & _ROW_MASK])
+            + np.uint64(tables[table, state >> _SHIFT_48]))
+
+
+@njit("UniTuple(uint64, 8)(uint64, uint32[:, ::1])", cache=True)
+def simulate_moves_packed(state, tables):
+    """Compute (state, score) for LEFT, RIGHT, UP and DOWN on a packed board."""
+    # After transposing, each row holds a column with its top tile in the high nibble,
+    # so UP is a LEFT move on the transposed board and DOWN is a RIGHT move.
+    transposed = transpose_packed(state)
+    return (_move_rows(state, tables, _LEFT_MOVES),
+            _score_rows(state, tables, _LEFT_SCORES),
+            _move_rows(state, tables, _RIGHT_MOVES),
+            _score_rows(state, tables, _RIGHT_SCORES),
+            transpose_packed(_move_rows(transposed, tables, _LEFT_MOVES)),
+            _score_rows(transposed, tables, _LEFT_SCORES),
+            transpose_packed(_move_rows(transposed, tables, _RIGHT_MOVES)),
+            _score_rows(transposed, tables, _RIGHT_SCORES))
+
+
+@njit("Tuple((uint64[:, ::1], uint32[:, ::1]))(uint64[::1], uint32[:, ::1])", cache=True)
+def _simulate_moves_batch(states, tables):
+    """Run simulate_moves_packed over an array of packed boards."""
+    next_states = np.empty((states.shape[0], 4), dtype=np.uint64)
+    scores = np.empty((states.shape[0], 4), dtype=np.uint32)
+    for i in range(states.shape[0]):
+        moves = simulate_moves_packed(states[i], tables)
+        for action in range(4):
+            next_states[i, action] = moves[2 * action]
+            scores[i, action] = moves[2 * action + 1]
+    return next_states, scores
+
+
 class Board:
     __is_lookup_tables_initialized: bool = False
-    __left_moves: list[int] = [0] * (2**16)
-    __right_moves: list[int] = [0] * (2**16)
-    __left_scores: list[int] = [0] * (2**16)
-    __right_scores: list[int] = [0] * (2**16)
-    __empty_cells: Dict[int, list[tuple[int, int]]] = {}
+    # One contiguous array for all four row tables, so a compiled call takes a single
+    # table argument; numba's per-call dispatch cost grows with every array passed.
+    __row_tables: np.ndarray = np.zeros((4, 2**16), dtype=np.uint32)
+    __left_moves: np.ndarray = __row_tables[_LEFT_MOVES]
+    __right_moves: np.ndarray = __row_tables[_RIGHT_MOVES]
+    __left_scores: np.ndarray = __row_tables[_LEFT_SCORES]
+    __right_scores: np.ndarray = __row_tables[_RIGHT_SCORES]
+    # Plain list: indexing it from Python is cheaper than indexing a numpy array.
+    __row_tile_sums: list[int] = []
+    __row_max_exponents: list[int] = []
+    # Transposition table for simulate_moves. It is kept across games (states recur
+    # between games too) and only cleared by Board.reset() or when it fills up.
+    SIMULATE_CACHE_SIZE: int = 1 << 16
+    __simulate_cache: Dict[int, tuple[tuple[int, int], ...]] = {}
 
     def __init__(self, state: int = 0):
         Board.__verify_state(state)
@@ -24,17 +216,21 @@ class Board:
             Board.__init_lookup_tables()
 
     @staticmethod
-    def get_empty_cells(state: int) -> Dict[int, list[tuple[int, int]]]:
-        Board.__verify_state(state)
-        if state in Board.__empty_cells:
-            return Board.__empty_cells[state]
-        else:
-            empty_tiles = []
-            for idx, value in enumerate(Board.get_unpacked_state(state)):
-                if value == 0:
-                    empty_tiles.append((idx // 4, idx % 4))
-            Board.__empty_cells[state] = empty_tiles
-        return Board.__empty_cells
+    def get_empty_cells(state: int) -> tuple[tuple[int, int], ...]:
+        return Board.get_empty_tiles(state)
+
+    @staticmethod
+    def get_row_tables() -> np.ndarray:
+        """Return the packed (4, 65536) row move/score table, for compiled callers such as the game loop."""
+        return Board.__row_tables
+
+    @staticmethod
+    def canonical(state: int) -> int:
+        """
+        Return the smallest of the eight rotations and reflections of state. Symmetric
+        boards share a canonical state, so it can key caches of symmetric evaluations.
+        """
+        return int(canonical_packed(np.uint64(state)))
 
     @staticmethod
     def is_lookup_tables_initialized() -> bool:
@@ -94,23 +290,19 @@ class Board:
         if Board.__is_lookup_tables_initialized:
             return
 
-        for i in range(2**16):
-            row = [
-                (i >> 12) & 0xF,
-                (i >> 8) & 0xF,
-                (i >> 4) & 0xF,
-                i & 0xF
-            ]
-            new_row_left, left_score = Board._move_left_with_score(row)
-            new_value_left = (new_row_left[0] << 12) | (new_row_left[1] << 8) | (new_row_left[2] << 4) | new_row_left[3]
-            Board.__left_moves[i] = new_value_left
-            Board.__left_scores[i] = left_score
-
-            new_row_right, right_score = Board._move_right_with_score(row)
-            new_value_right = (new_row_right[0] << 12) | (new_row_right[1] << 8) | (new_row_right[2] << 4) | new_row_right[3]
-            Board.__right_moves[i] = new_value_right
-            Board.__right_scores[i] = right_score
-
+        # _move_left_with_score stays the readable reference; the tables themselves
+        # are generated by the compiled _fill_row_tables.
+        _fill_row_tables(
+            Board.__left_moves,
+            Board.__right_moves,
+            Board.__left_scores,
+            Board.__right_scores,
+        )
+        row_sums = np.zeros(2**16, dtype=np.uint32)
+        row_maxes = np.zeros(2**16, dtype=np.uint8)
+        _fill_row_stat_tables(row_sums, row_maxes)
+        Board.__row_tile_sums = row_sums.tolist()
+        Board.__row_max_exponents = row_maxes.tolist()
         Board.__is_lookup_tables_initialized = True
 
     @staticmethod
@@ -124,7 +316,7 @@ class Board:
     def _row_left(row: int) -> tuple[int, int]:
         # Verify row.
         Board.__verify_row_left(row)
-        return Board.__left_moves[row], Board.__left_scores[row]
+        return int(Board.__left_moves[row]), int(Board.__left_scores[row])
 
     @staticmethod
     def __verify_row_right(row: int) -> None:
@@ -138,7 +330,7 @@ class Board:
         Board.__verify_row_right(row)
         if not Board.__is_lookup_tables_initialized:
             Board.__init_lookup_tables()
-        return Board.__right_moves[row], Board.__right_scores[row]
+        return int(Board.__right_moves[row]), int(Board.__right_scores[row])
 
     @staticmethod
     def __verify_state(state: int) -> bool:
@@ -151,74 +343,118 @@ class Board:
         return True
 
     @staticmethod
-    def simulate_moves(state: int) -> list[tuple[int, int]]:
+    def simulate_moves(state: int) -> tuple[tuple[int, int], ...]:
         # Verify input
         Board.__verify_state(state)
+        return Board._simulate_moves_unchecked(state)
+
+    @staticmethod
+    def _simulate_moves_unchecked(state: int) -> tuple[tuple[int, int], ...]:
+        (new_state_left, score_left,
+         new_state_right, score_right,
+         new_state_up, score_up,
+         new_state_down, score_down) = simulate_moves_packed(state, Board.__row_tables)
+        return ((new_state_left, score_left),
+                (new_state_right, score_right),
+                (new_state_up, score_up),
+                (new_state_down, score_down))
+
+    @staticmethod
+    def simulate_moves_batch(states: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate all four moves for every packed state in a uint64 array.
+
+        Returns an (N, 4) array of next states and an (N, 4) array of move scores,
+        with columns ordered like Action.
+        """
+        return _simulate_moves_batch(np.ascontiguousarray(states, dtype=np.uint64), Board.__row_tables)
+
+    @staticmethod
+    def get_nibbles_batch(states: np.ndarray) -> np.ndarray:
+        """Return a (..., 16) uint8 array of tile exponents; column k is the tile at bits 4k..4k+3."""
+        states = np.asarray(states, dtype=np.uint64)
+        return ((states[..., None] >> _NIBBLE_SHIFTS) & _NIBBLE_MASK).astype(np.uint8)
 
-        # Horizontal moves: LEFT and RIGHT.
-        new_state_left = new_state_right = 0
-        score_left = score_right = 0
-        for row_index in range(4):
-            row = (state >> (16 * row_index)) & 0xFFFF
-            new_row_left, row_score_left = Board._row_left(row)
-            new_row_right, row_score_right = Board._row_right(row)
-            new_state_left |= new_row_left << (16 * row_index)
-            new_state_right |= new_row_right << (16 * row_index)
-            score_left += row_score_left
-            score_right += row_score_right
-
-        # Vertical moves: reuse the row extraction.
-        rows = [(state >> (16 * i)) & 0xFFFF for i in range(4)]
-        new_rows_up = [0, 0, 0, 0]
-        new_rows_down = [0, 0, 0, 0]
-        score_up = score_down = 0
-        for col in range(4):
-            col_value = 0
-            for row_index in range(4):
-                tile = (rows[row_index] >> (4 * (3 - col))) & 0xF
-                col_value |= tile << (4 * (3 - row_index))
-            new_col_value_up, col_score_up = Board._row_right(col_value)
-            new_col_value_down, col_score_down = Board._row_left(col_value)
-            score_up += col_score_up
-            score_down += col_score_down
-            for row_index in range(4):
-                new_tile_up = (new_col_value_up >> (4 * (3 - row_index))) & 0xF
-                new_tile_down = (new_col_value_down >> (4 * (3 - row_index))) & 0xF
-                new_rows_up[row_index] |= new_tile_up << (4 * (3 - col))
-                new_rows_down[row_index] |= new_tile_down << (4 * (3 - col))
-        new_state_up = new_state_down = 0
-        for row_index in range(4):
-            new_state_up |= new_rows_up[row_index] << (16 * row_index)
-            new_state_down |= new_rows_down[row_index] << (16 * row_index)
-
-        return [(new_state_left, score_left), 
-                (new_state_right, score_right), 
-                (new_state_up, score_up), 
-                (new_state_down, score_down)]
+    @staticmethod
+    def get_empty_nibbles_batch(states: np.ndarray) -> np.ndarray:
+        """Return a (..., 16) bool array marking empty cells; column k is the tile at bits 4k..4k+3."""
+        states = np.asarray(states, dtype=np.uint64)
+        return ((states[..., None] >> _NIBBLE_SHIFTS) & _NIBBLE_MASK) == 0
+
+    @staticmethod
+    def simulate_moves_cached(state: int) -> tuple[tuple[int, int], ...]:
+        """Same as simulate_moves, memoized in a bounded transposition table."""
+        moves = Board.__simulate_cache.get(state)
+        if moves is None:
+            if len(Board.__simulate_cache) >= Board.SIMULATE_CACHE_SIZE:
+                Board.__simulate_cache.clear()
+            moves = Board.simulate_moves(state)
+            Board.__simulate_cache[state] = moves
+        return moves
 
     @staticmethod
     def get_valid_move_actions(state: int) -> list[tuple[Action, int, int]]:
         valid_actions = []
-        next_states_with_scores = Board.simulate_moves(state)
-        for action_value, (next_state, score) in enumerate(next_states_with_scores):
+        for action, (next_state, score) in zip(_ACTIONS, Board.simulate_moves_cached(state)):
             if next_state != state:
-                valid_actions.append((Action(action_value), next_state, score))
+                valid_actions.append((action, next_state, score))
         return valid_actions
 
     @staticmethod
-    def get_empty_tiles(state: int) -> list[tuple[int, int]]:
+    def get_empty_tiles(state: int) -> tuple[tuple[int, int], ...]:
         # Verify input
         Board.__verify_state(state)
+        return Board._get_empty_tiles_unchecked(state)
+
+    @staticmethod
+    def _get_empty_tiles_unchecked(state: int) -> tuple[tuple[int, int], ...]:
+        mask = Board.get_empty_mask(state)
+        return _EMPTY_TILES_HIGH[mask >> 8] + _EMPTY_TILES_LOW[mask & 0xFF]
+
+    @staticmethod
+    def get_empty_indices(state: int) -> tuple[int, ...]:
+        """Return the flat index i (tile at bits 4i..4i+3) of every empty tile."""
+        mask = Board.get_empty_mask(state)
+        return _EMPTY_INDICES_LOW[mask & 0xFF] + _EMPTY_INDICES_HIGH[mask >> 8]
 
-        if state in Board.__empty_cells:
-            return Board.__empty_cells[state]
-        else:
-            empty_tiles = []
-            for idx, value in enumerate(Board.get_unpacked_state(state)):
-                if value == 0:
-                    empty_tiles.append((idx // 4, idx % 4))
-            Board.__empty_cells[state] = empty_tiles
-        return empty_tiles
+    @staticmethod
+    def get_empty_mask(state: int) -> int:
+        """Return a 16-bit mask with bit i set when the tile at bits 4i..4i+3 is empty."""
+        # Fold every nibble onto its lowest bit, keep the empty ones, then squeeze
+        # the 16 flags (4 bits apart) into 16 adjacent bits.
+        occupied = state | (state >> 1)
+        occupied |= occupied >> 2
+        mask = ~occupied & 0x1111111111111111
+        mask = (mask | (mask >> 3)) & 0x0303030303030303
+        mask = (mask | (mask >> 6)) & 0x000F000F000F000F
+        mask = (mask | (mask >> 12)) & 0x000000FF000000FF
+        return (mask | (mask >> 24)) & 0xFFFF
+
+    @staticmethod
+    def get_tile_sum(state: int) -> int:
+        """Return the sum of all tile values (2**tile for every non-empty tile)."""
+        row_sums = Board.__row_tile_sums
+        return (
+            row_sums[state & 0xFFFF]
+            + row_sums[(state >> 16) & 0xFFFF]
+            + row_sums[(state >> 32) & 0xFFFF]
+            + row_sums[state >> 48]
+        )
+
+    @staticmethod
+    def get_max_exponent(state: int) -> int:
+        """Return the exponent of the largest tile (0 for an empty board)."""
+        row_maxes = Board.__row_max_exponents
+        return max(
+            row_maxes[state & 0xFFFF],
+            row_maxes[(state >> 16) & 0xFFFF],
+            row_maxes[(state >> 32) & 0xFFFF],
+            row_maxes[state >> 48],
+        )
+
+    @staticmethod
+    def count_empty_tiles(state: int) -> int:
+        return Board.get_empty_mask(state).bit_count()
 
     @staticmethod
     def __verify_row_col(row: int, col: int):
@@ -235,7 +471,10 @@ class Board:
         Board.__verify_state(state)
         Board.__verify_row_col(row, col)
         Board.__verify_value(value)
+        return Board._set_tile_unchecked(state, row, col, value)
 
+    @staticmethod
+    def _set_tile_unchecked(state: int, row: int, col: int, value: int):
         # Convert row/col to bit position from left to right
         i = (3 - row) * 4 + (3 - col)
         if ((state >> (i * 4)) & 0xF) != 0:
@@ -243,12 +482,20 @@ class Board:
         state |= value << (i * 4)
         return state
 
+    @staticmethod
+    def _set_tile_fast(state: int, index: int, value: int) -> int:
+        # Precondition: index comes from get_empty_indices(state), so the tile is empty.
+        return state | (value << (index * 4))
+
     # set_state and get_state stay instance methods.
     def set_state(self, state: int):
         # Verify state.
         Board.__verify_state(state)
         self.__state = state
 
+    def _set_state_unchecked(self, state: int):
+        self.__state = state
+
     def get_state(self, unpack: bool = False) -> int | list[int]:
         # Verify unpack is of type bool
         if not isinstance(unpack, bool):
@@ -260,11 +507,17 @@ class Board:
     @staticmethod
     def get_unpacked_state(state: int) -> list[int]:
         Board.__verify_state(state)
-        return [(state >> (i * 4)) & 0xF for i in range(15, -1, -1)]
+        return Board._get_unpacked_state_unchecked(state)
+
+    @staticmethod
+    def _get_unpacked_state_unchecked(state: int) -> list[int]:
+        b0, b1, b2, b3, b4, b5, b6, b7 = state.to_bytes(8, "big")
+        return [*_UNPACKED_BYTES[b0], *_UNPACKED_BYTES[b1], *_UNPACKED_BYTES[b2], *_UNPACKED_BYTES[b3],
+                *_UNPACKED_BYTES[b4], *_UNPACKED_BYTES[b5], *_UNPACKED_BYTES[b6], *_UNPACKED_BYTES[b7]]
 
     @staticmethod
     def reset():
-        Board.__empty_cells = {}
+        Board.__simulate_cache = {}
 
     @staticmethod
     def pretty_print(state: int):
@@ -277,26 +530,30 @@ class Board:
 
     @staticmethod
     def disable_verifiers():
-        Board.original_verifiers = {
-            "__verify_state": Board.__verify_state,
-            "__verify_row_col": Board.__verify_row_col,
-            "__verify_value": Board.__verify_value,
-            "__move_left_verifier": Board.__move_left_verifier,
-            "__verify_row_left": Board.__verify_row_left,
-            "__verify_row_right": Board.__verify_row_right
-        }
-        Board.__verify_state = lambda state: None
-        Board.__verify_row_col = lambda row, col: None
-        Board.__verify_value = lambda value: None
-        Board.__move_left_verifier = lambda row: None
-        Board.__verify_row_left = lambda row: None
-        Board.__verify_row_right = lambda row: None
+        set_board_mode("fast")
 
     @staticmethod
     def enable_verifiers():
-        Board.__verify_state = Board.original_verifiers["__verify_state"]
-        Board.__verify_row_col = Board.original_verifiers["__verify_row_col"]
-        Board.__verify_value = Board.original_verifiers["__verify_value"]
-        Board.__move_left_verifier = Board.original_verifiers["__move_left_verifier"]
-        Board.__verify_row_left = Board.original_verifiers["__verify_row_left"]
-        Board.__verify_row_right = Board.original_verifiers["__verify_row_right"]
+        set_board_mode("checked")
+
+
+# Methods called on every move. In "fast" mode they are rebound to their *_unchecked
+# variants so the verifier calls disappear instead of being swapped for no-op lambdas.
+# The swap happens on the Board class itself because other modules hold references to it.
+_HOT_PATHS = ("simulate_moves", "get_empty_tiles", "set_tile", "set_state", "get_unpacked_state")
+_BOARD_MODES = {
+    "checked": {name: Board.__dict__[name] for name in _HOT_PATHS},
+    "fast": {name: Board.__dict__[f"_{name}_unchecked"] for name in _HOT_PATHS},
+}
+
+
+def set_board_mode(mode: str) -> None:
+    """Select "checked" (verify every argument, the default) or "fast" Board hot paths."""
+    if mode not in _BOARD_MODES:
+        raise ValueError(f"Invalid board mode: {mode}. Available modes: {list(_BOARD_MODES)}")
+    for name, method in _BOARD_MODES[mode].items():
+        setattr(Board, name, method)
+
+
+# Populate the lookup tables once at import so the JIT kernel never sees empty tables.
+Board._Board__init_lookup_tables()
@@ -4,10 +4,14 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
     __package__ = "src"
 
-import random
 import logging
-from .players import Player, RandomPlayer, MaxEmptyCellsPlayer, HumanPlayer, HeuristicPlayer, MinMaxPlayer
-from .board import Board
+import numpy as np
+from numba import njit
+from .players import (
+    Player, RandomPlayer, MaxEmptyCellsPlayer, HumanPlayer, HeuristicPlayer, MinMaxPlayer, ExpectimaxPlayer,
+    COMPILED_POLICY_RANDOM, COMPILED_POLICY_MAX_EMPTY, COMPILED_POLICY_MAX_TILE_SUM, RANDOM_BUFFER_SIZE,
+)
+from .board import Board, simulate_moves_packed
 from .interfaces import GUI2048, CLI2048, GYM2048
 
 
@@ -16,11 +20,14 @@ MOVE_COUNT_PROGRESS_PRINT = 500
 logger = logging.getLogger(__name__)
 
 class Game2048:
-    def __init__(self, board: Board | None = None, player: Player | None = None, move_count: int = 0, interface=None):
+    def __init__(self, board: Board | None = None, player: Player | None = None, move_count: int = 0, interface=None,
+                 rng: np.random.Generator | None = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.__random_buffer: list[float] = []
         if board is None:
             self.board = Board()
             # Only add initial random tiles if creating a new board
-            while len(Board.get_empty_tiles(self.board.get_state())) > 14:
+            while Board.count_empty_tiles(self.board.get_state()) > 14:
                 self.add_random_tile()
         else:
             self.board = board
@@ -30,16 +37,30 @@ class Game2048:
         self.player = player if player else RandomPlayer()
         self.interface = interface
 
+    def seed(self, seed: int | np.random.SeedSequence) -> None:
+        """Reseed this game's generator, which spawns tiles and is handed to the player, so the next game is reproducible."""
+        self.rng = np.random.default_rng(seed)
+        self.__random_buffer = []
+
+    def __next_random(self) -> float:
+        # Draw uniforms in bulk from the numpy generator; popping a Python float off
+        # a list is much cheaper than a random-module call per spawn.
+        if not self.__random_buffer:
+            self.__random_buffer = self.rng.random(RANDOM_BUFFER_SIZE).tolist()
+        return self.__random_buffer.pop()
+
+    def _spawn_tile(self, state: int) -> int:
+        """Return state with a new 2 (90%) or 4 (10%) tile on a random empty cell."""
+        empty_indices = Board.get_empty_indices(state)
+        if not empty_indices:
+            return state
+        index = empty_indices[int(self.__next_random() * len(empty_indices))]
+        # One lazily formatted call per spawn; this runs on every move
+        logger.debug("Chosen tile %s of empty tiles %s", index, empty_indices)
+        return Board._set_tile_fast(state, index, 1 if self.__next_random() < 0.9 else 2)
+
     def add_random_tile(self):
-        current_state = self.board.get_state()
-        empty_tiles = Board.get_empty_tiles(current_state)
-        logger.debug("Empty tiles: %s", empty_tiles)
-        if not empty_tiles:
-            return
-        row, col = random.choice(empty_tiles)
-        logger.debug("Chosen tile: %s", (row, col))
-        new_state = Board.set_tile(current_state, row, col, 1 if random.random() < 0.9 else 2)
-        self.board.set_state(new_state)
+        self.board.set_state(self._spawn_tile(self.board.get_state()))
 
     def play_move(self):
         valid_actions = Board.get_valid_move_actions(self.board.get_state())
@@ -56,21 +77,216 @@ class Game2048:
         return self.score
 
     def reset(self):
-        self.board = Board()
+        self.board.set_state(0)
+        self.player.reset(self.rng)
         self.move_count = 0
         self.score = 0
         self.add_random_tile()
         self.add_random_tile()
 
-    def play_game(self):
+    def play_game(self, seed: int | np.random.SeedSequence | None = None):
+        if seed is not None:
+            self.seed(seed)
         self.reset()
-        self.interface.display_initial_board(self.board.get_state(), self.score)
+        if self.interface:
+            self.interface.display_initial_board(self.board.get_state(), self.score)
         while self.play_move():
             self.move_count += 1
             if self.interface:
                 self.interface.update(state=self.board.get_state(), move_count=self.move_count, score=self.score)
+        if self.interface:
+            self.interface.game_finished(self.board.get_state(), self.move_count, self.score)
         return self.get_score(), self.board.get_state(), self.move_count
 
+    def play_game_fast(self, seed: int | np.random.SeedSequence | None = None):
+        """
+        Same as play_game, for benchmarks: the board state, score and move count live in
+        locals for the whole game, and the interface only hears about the start and the
+        end of the game (game_finished) instead of every move.
+        """
+        if seed is not None:
+            self.seed(seed)
+        self.reset()
+        state = self.board.get_state()
+        if self.interface:
+            self.interface.display_initial_board(state, 0)
+        choose_action = self.player.choose_action
+        get_valid_move_actions = Board.get_valid_move_actions
+        spawn_tile = self._spawn_tile
+        score = move_count = 0
+        while valid_actions := get_valid_move_actions(state):
+            _, state, move_score = choose_action(valid_actions)
+            score += move_score
+            state = spawn_tile(state)
+            move_count += 1
+        self.board.set_state(state)
+        self.score = score
+        self.move_count = move_count
+        if self.interface:
+            self.interface.game_finished(state, move_count, score)
+        return score, state, move_count
+
+def _add_random_tiles(states: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Vectorized add_random_tile: spawn one tile on a random empty cell of every state."""
+    empty = Board.get_empty_nibbles_batch(states)
+    empty_counts = empty.sum(axis=1)
+    picks = (rng.random(len(states)) * empty_counts).astype(np.int64)
+    # The chosen cell is the first one whose running empty count exceeds the pick.
+    cells = (empty.cumsum(axis=1) > picks[:, None]).argmax(axis=1).astype(np.uint64)
+    values = np.where(rng.random(len(states)) < 0.9, 1, 2).astype(np.uint64)
+    spawned = states | (values << (cells * np.uint64(4)))
+    return np.where(empty_counts > 0, spawned, states)
+
+def play_games_batched(player: Player, num_games: int,
+                       rng: np.random.Generator | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Play num_games independent games side by side, one move per game per step.
+
+    The games are stored as a uint64 array of packed states so every step is a handful
+    of vectorized calls instead of num_games Python-level moves. The player must
+    support batched play (see Player.supports_batch).
+
+    Returns:
+        Arrays of final scores, final states and move counts, one entry per game.
+    """
+    if not player.supports_batch:
+        raise ValueError(f"{type(player).__name__} does not support batched play")
+    if rng is None:
+        rng = np.random.default_rng()
+    states = np.zeros(num_games, dtype=np.uint64)
+    states = _add_random_tiles(_add_random_tiles(states, rng), rng)
+    scores = np.zeros(num_games, dtype=np.int64)
+    move_counts = np.zeros(num_games, dtype=np.int64)
+
+    active = np.arange(num_games)
+    while active.size:
+        next_states, move_scores = Board.simulate_moves_batch(states[active])
+        valid = next_states != states[active, None]
+        playable = valid.any(axis=1)
+        active = active[playable]
+        if not active.size:
+            break
+        next_states, move_scores, valid = next_states[playable], move_scores[playable], valid[playable]
+
+        actions = player.choose_actions_batch(next_states, valid, rng)
+        rows = np.arange(active.size)
+        states[active] = _add_random_tiles(next_states[rows, actions], rng)
+        scores[active] += move_scores[rows, actions]
+        move_counts[active] += 1
+
+    return scores, states, move_counts
+
+_NIBBLE = np.uint64(0xF)
+
+
+@njit("int64(uint64)", cache=True)
+def _count_empty(state):
+    count = 0
+    for i in range(16):
+        if (state >> np.uint64(4 * i)) & _NIBBLE == 0:
+            count += 1
+    return count
+
+
+@njit("int64(uint64)", cache=True)
+def _tile_sum(state):
+    total = 0
+    for i in range(16):
+        tile = (state >> np.uint64(4 * i)) & _NIBBLE
+        if tile:
+            total += 1 << tile
+    return total
+
+
+@njit("uint64(uint64)", cache=True)
+def _spawn_tile_compiled(state):
+    """Compiled _spawn_tile: a 2 (90%) or 4 (10%) on a uniformly chosen empty cell."""
+    count = _count_empty(state)
+    if count == 0:
+        return state
+    pick = np.random.randint(0, count)
+    value = np.uint64(1) if np.random.random() < 0.9 else np.uint64(2)
+    for i in range(16):
+        shift = np.uint64(4 * i)
+        if (state >> shift) & _NIBBLE == 0:
+            if pick == 0:
+                return state | (value << shift)
+            pick -= 1
+    return state
+
+
+@njit("Tuple((int64[::1], uint64[::1], int64[::1]))(int64[::1], int64, uint32[:, ::1])", cache=True)
+def _play_games_compiled(seeds, policy, tables):
+    """Play one game per seed entirely in compiled code, choosing moves with a COMPILED_POLICY_* rule."""
+    num_games = seeds.shape[0]
+    scores = np.zeros(num_games, dtype=np.int64)
+    states = np.zeros(num_games, dtype=np.uint64)
+    move_counts = np.zeros(num_games, dtype=np.int64)
+    next_states = np.empty(4, dtype=np.uint64)
+    move_scores = np.empty(4, dtype=np.int64)
+    for game in range(num_games):
+        np.random.seed(seeds[game])
+        state = _spawn_tile_compiled(_spawn_tile_compiled(np.uint64(0)))
+        score = 0
+        moves = 0
+        while True:
+            result = simulate_moves_packed(state, tables)
+            num_valid = 0
+            for action in range(4):
+                next_states[action] = result[2 * action]
+                move_scores[action] = result[2 * action + 1]
+                if next_states[action] != state:
+                    num_valid += 1
+            if num_valid == 0:
+                break
+
+            # Pick among the valid actions; ties keep the first action, like max() does.
+            chosen = -1
+            if policy == COMPILED_POLICY_RANDOM:
+                pick = np.random.randint(0, num_valid)
+                for action in range(4):
+                    if next_states[action] != state:
+                        if pick == 0:
+                            chosen = action
+                            break
+                        pick -= 1
+            else:
+                best_value = -1
+                for action in range(4):
+                    if next_states[action] == state:
+                        continue
+                    if policy == COMPILED_POLICY_MAX_EMPTY:
+                        value = _count_empty(next_states[action])
+                    else:
+                        value = _tile_sum(next_states[action])
+                    if value > best_value:
+                        best_value = value
+                        chosen = action
+
+            score += move_scores[chosen]
+            state = _spawn_tile_compiled(next_states[chosen])
+            moves += 1
+        scores[game] = score
+        states[game] = state
+        move_counts[game] = moves
+    return scores, states, move_counts
+
+
+def play_games_compiled(player: Player, seeds) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Play one game per seed with the whole game loop compiled by numba.
+
+    Only players with a compiled_policy are supported. The games follow the same rules
+    and move policy as play_game, but draw from numba's own random generator, so a
+    seed does not replay the same game as play_game(seed=...).
+
+    Returns:
+        Arrays of final scores, final states and move counts, one entry per game.
+    """
+    if player.compiled_policy is None:
+        raise ValueError(f"{type(player).__name__} has no compiled move policy")
+    return _play_games_compiled(np.asarray(seeds, dtype=np.int64), player.compiled_policy, Board.get_row_tables())
+
 if __name__ == "__main__":
     import cProfile
     import pstats
@@ -85,6 +301,7 @@ if __name__ == "__main__":
             MaxEmptyCellsPlayer,
             MinMaxPlayer,
             HeuristicPlayer,
+            ExpectimaxPlayer,
         ]
     }
 
@@ -109,8 +326,8 @@ if __name__ == "__main__":
     if player_key in player_mapping:
         player_cls = player_mapping[player_key]
     else:
-        logger.info(f"Unknown player type '{args.player}'. Using Human player instead.")
-        logger.info(f"Available player types: {list(player_mapping.keys())}")
+        logger.info("Unknown player type '%s'. Using Human player instead.", args.player)
+        logger.info("Available player types: %s", list(player_mapping))
         player_cls = HumanPlayer
 
     # If the player is Human, force the number of games to be 1
@@ -129,7 +346,7 @@ if __name__ == "__main__":
     best_state = None
     best_move_count = 0
     num_of_games = args.num_games
-    logger.info(f"Playing {num_of_games} games with {player_cls.__name__}...")
+    logger.info("Playing %d games with %s...", num_of_games, player_cls.__name__)
 
     for i in range(num_of_games):
         score, state, move_count = game.play_game()
@@ -137,7 +354,6 @@ if __name__ == "__main__":
             best_score = score
             best_state = state
             best_move_count = move_count
-        game.reset()
 
     # Add a newline after progress updates
     if args.num_games > 1:
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .board import Board
-import os
+import sys
 import time
 
 # Define color codes for each tile value (foreground and background)
@@ -19,8 +19,25 @@ TILE_COLORS = {
     12: ('\033[30m', '\033[48;5;231m'), # 4096: black text on bright white
 }
 RESET_COLOR = '\033[0m'
+# Cursor home + clear screen; the tile colors already rely on ANSI escape support
+CLEAR_SCREEN = '\033[H\033[2J'
 CELL_WIDTH = 6
 
+def _render_cell(exponent: int) -> str:
+    """Render one colored, centered cell for a tile exponent (0: empty cell)."""
+    if exponent == 0:
+        return ' ' * CELL_WIDTH
+    fg_color, bg_color = TILE_COLORS.get(exponent, TILE_COLORS[12])
+    value = str(2**exponent)
+    # Calculate padding to center the number in CELL_WIDTH
+    left_padding = ' ' * ((CELL_WIDTH - len(value)) // 2)
+    right_padding = ' ' * (CELL_WIDTH - len(value) - len(left_padding))
+    # Apply colors to the entire cell including padding
+    return f"{fg_color}{bg_color}{left_padding}{value}{right_padding}{RESET_COLOR}"
+
+# Rendered cell for every exponent a board nibble can hold
+_CELL_CACHE = tuple(_render_cell(exponent) for exponent in range(16))
+
 class Interface2048(ABC):
     def __init__(self):
         self.name = ""
@@ -32,6 +49,10 @@ class Interface2048(ABC):
     def update(self, state: int, move_count: int, score: int) -> None:
         pass
 
+    def game_finished(self, state: int, move_count: int, score: int) -> None:
+        """Called once when a game ends, with its final board, move count and score."""
+        pass
+
 class GUI2048(Interface2048):
     def __init__(self):
         self.name = "GUI"
@@ -48,40 +69,29 @@ class CLI2048(Interface2048):
         self.first_update = True
 
     @staticmethod
-    def pretty_print(board: int, score: int, move_count: int, clear_screen: bool = True):
-        if clear_screen:
-            os.system('cls' if os.name == 'nt' else 'clear')
-        
-        print(f"Score: {score}")
+    def pretty_format(board: int, score: int, move_count: int) -> str:
+        """Render the score, move count and colored board as a string."""
+        lines = [f"Score: {score}"]
         if move_count:
-            print(f"Move count: {move_count}")
+            lines.append(f"Move count: {move_count}")
 
-        cells = [tile for tile in Board.get_unpacked_state(board)]
-        
-        # Convert each cell: if non-zero, display 2**cell with color, else empty string
-        display_cells = []
-        for cell in cells:
-            if cell > 0:
-                fg_color, bg_color = TILE_COLORS.get(cell, TILE_COLORS[12])
-                value = str(2**cell)
-                # Calculate padding to center the number in CELL_WIDTH
-                left_padding = ' ' * ((CELL_WIDTH - len(value)) // 2)
-                right_padding = ' ' * (CELL_WIDTH - len(value) - len(left_padding))
-                # Apply colors to the entire cell including padding
-                display_cells.append(f"{fg_color}{bg_color}{left_padding}{value}{right_padding}{RESET_COLOR}")
-            else:
-                # Empty cell with consistent width
-                display_cells.append(' ' * CELL_WIDTH)
+        display_cells = [_CELL_CACHE[cell] for cell in Board.get_unpacked_state(board)]
 
         # Define borders with consistent width
         horizontal_line = '+' + ('-' * CELL_WIDTH + '+') * 4
 
-        print(horizontal_line)
+        lines.append(horizontal_line)
         for row in range(4):
             row_cells = display_cells[row * 4 : (row + 1) * 4]
-            row_str = '|' + '|'.join(row_cells) + '|'
-            print(row_str)
-            print(horizontal_line)
+            lines.append('|' + '|'.join(row_cells) + '|')
+            lines.append(horizontal_line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def pretty_print(board: int, score: int, move_count: int, clear_screen: bool = True):
+        text = CLI2048.pretty_format(board, score, move_count)
+        # Clearing only makes sense on a terminal, not in redirected output
+        print(CLEAR_SCREEN + text if clear_screen and sys.stdout.isatty() else text)
 
     def display_initial_board(self, state: int, score: int = 0):
         """
@@ -103,26 +113,26 @@ class CLI2048(Interface2048):
             self.first_update = False
 
 class GYM2048(Interface2048):
-    def __init__(self):
+    def __init__(self, enabled: bool = True):
         self.name = "GYM"
+        # When False, games are still counted but no progress is printed
+        self.enabled = enabled
         self.total_games = 0
         self.current_game = 0
         self.best_score = 0
         self.start_time = None
+        # Games between progress lines (every 1%); set by set_total_games
+        self._report_every = 1
 
-    def display_initial_board(self, state: int, score: int = 0):
-        """Called at the start of each game"""
-        # Initialize start time on first game
-        if self.current_game == 0:
-            self.start_time = time.time()
-        
-        # Increment game counter
+    def game_finished(self, state: int, move_count: int, score: int) -> None:
+        """Count a finished game and show progress every 1%"""
         self.current_game += 1
-        
-        # Show progress every 1%
-        if self.current_game % max(1, self.total_games // 100) == 0:
+        if score > self.best_score:
+            self.best_score = score
+
+        if self.enabled and self.current_game % self._report_every == 0:
             progress = (self.current_game / self.total_games) * 100
-            elapsed_time = time.time() - self.start_time
+            elapsed_time = time.perf_counter() - self.start_time
             # Use \r to overwrite the line and \033[K to clear to the end of line
             print(f"\rProgress: {progress:5.1f}% ({self.current_game}/{self.total_games} games) - "
                   f"Best score: {self.best_score} - "
@@ -131,7 +141,10 @@ class GYM2048(Interface2048):
     def set_total_games(self, total_games: int):
         """Set the total number of games to be played."""
         self.total_games = total_games
-        print(f"Starting simulation of {total_games} games...")
+        self._report_every = max(1, total_games // 100)
+        self.start_time = time.perf_counter()
+        if self.enabled:
+            print(f"Starting simulation of {total_games} games...")
 
     def update(self, state: int, move_count: int, score: int) -> None:
         # Update best score if current score is higher
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
-import cProfile
 import logging
-import pstats
-from datetime import datetime
 
 from .game import Game2048
 from .board import Board
@@ -15,40 +12,46 @@ from .players import (
     MaxEmptyCellsPlayer,
     MinMaxPlayer,
     HeuristicPlayer,
+    ExpectimaxPlayer,
 )
 from .interfaces import CLI2048, GYM2048
 from . import benchmark
 
 logger = logging.getLogger(__name__)
 
+# Player name (as given to --player) to player class.
+PLAYER_MAPPING: dict[str, type[Player]] = {
+    cls.__name__.replace("Player", "").lower(): cls
+    for cls in [
+        RandomPlayer,
+        HumanPlayer,
+        MaxEmptyCellsPlayer,
+        MinMaxPlayer,
+        HeuristicPlayer,
+        ExpectimaxPlayer,
+    ]
+}
+
 def get_player_mapping() -> dict[str, type[Player]]:
     """Return a mapping of player name to player class."""
-    return {
-        cls.__name__.replace("Player", "").lower(): cls
-        for cls in [
-            RandomPlayer,
-            HumanPlayer,
-            MaxEmptyCellsPlayer,
-            MinMaxPlayer,
-            HeuristicPlayer,
-        ]
-    }
+    return PLAYER_MAPPING
 
 def play_games(args: argparse.Namespace) -> None:
     """Play the specified number of games with the chosen player."""
     if args.profile_en:
+        import cProfile
         profiler = cProfile.Profile()
         profiler.enable()
 
-    player_mapping = get_player_mapping()
     player_key = args.player.lower()
     
-    if player_key not in player_mapping:
-        logger.error(f"Unknown player type '{args.player}'")
-        logger.error(f"Available player types: {list(player_mapping.keys())}")
+    if player_key not in PLAYER_MAPPING:
+        logger.error("Unknown player type '%s'", args.player)
+        logger.error("Available player types: %s", list(PLAYER_MAPPING))
         raise SystemExit(1)
         
-    player_cls = player_mapping[player_key]
+    player_cls = PLAYER_MAPPING[player_key]
+    player_kwargs = benchmark.get_player_kwargs(args).get(player_cls, {})
 
     # If the player is Human, force the number of games to be 1
     if player_cls == HumanPlayer:
@@ -61,20 +64,26 @@ def play_games(args: argparse.Namespace) -> None:
     else:
         interface = CLI2048()
 
-    game = Game2048(player=player_cls(), interface=interface)
     best_score = 0
     best_state = None
     best_move_count = 0
     
-    logger.info(f"Playing {args.num_games} games with {player_cls.__name__}...")
+    logger.info("Playing %d games with %s...", args.num_games, player_cls.__name__)
+
+    if args.num_games > 1 and args.workers != 1:
+        games = benchmark.play_parallel(player_cls, args.num_games, args.workers,
+                                        optimize=True, interface=interface, player_kwargs=player_kwargs)
+    else:
+        game = Game2048(player=player_cls(**player_kwargs), interface=interface)
+        # GYM only needs each game's final score, so it skips the per-move updates
+        play = game.play_game_fast if args.num_games > 1 else game.play_game
+        games = (play() for _ in range(args.num_games))
 
-    for _ in range(args.num_games):
-        score, state, move_count = game.play_game()
+    for score, state, move_count in games:
         if score > best_score:
             best_score = score
             best_state = state
             best_move_count = move_count
-        game.reset()
 
     # Add a newline after progress updates
     if args.num_games > 1:
@@ -82,6 +91,8 @@ def play_games(args: argparse.Namespace) -> None:
 
     if args.profile_en:
         profiler.disable()
+        import pstats
+        from datetime import datetime
         date_time = datetime.now().strftime("%Y%m%d_%H%M%S")
         profile_filename = f'{player_cls.__name__}_{args.num_games}_{date_time}.txt'
         with open(profile_filename, 'w') as f:
@@ -101,7 +112,10 @@ def main() -> int:
     play_parser.add_argument("--profile_en", action="store_true", help="Enable profiling")
     play_parser.add_argument("-n", "--num_games", type=int, default=1, help="Number of games to play")
     play_parser.add_argument("-p", "--player", type=str, default="human",
-                          help=f"Player type {list(get_player_mapping().keys())}")
+                          help=f"Player type {list(PLAYER_MAPPING.keys())}")
+    play_parser.add_argument("--workers", type=int, default=1,
+                          help="Number of worker processes for multiple games, 0 for one per CPU (default: 1)")
+    benchmark.add_player_arguments(play_parser)
     play_parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
 
     # Benchmark command - delegate to benchmark module
@@ -1,9 +1,156 @@
 from abc import ABC, abstractmethod
-from .board import Action, Board
-import random
-import readchar
+from .board import Action, Board, canonical_packed, simulate_moves_packed, transpose_packed
+from numba import njit
+import numpy as np
+import sys
+import time
+
+# Number of uniform floats drawn per refill of Game2048's tile-spawn buffer and RandomPlayer's.
+RANDOM_BUFFER_SIZE = 4096
+
+# Move policies the compiled game loop (game.play_games_compiled) can play on its own.
+COMPILED_POLICY_RANDOM, COMPILED_POLICY_MAX_EMPTY, COMPILED_POLICY_MAX_TILE_SUM = range(3)
+
+# Rows of _HEURISTIC_ROW_TABLES: per 16-bit row, its empty cells, the summed exponent
+# differences of adjacent cells, the summed value differences of adjacent non-empty
+# cells, and its largest exponent.
+_ROW_EMPTY, _ROW_MONOTONICITY, _ROW_SMOOTHNESS, _ROW_MAX = range(4)
+
+
+@njit("void(int32[:, ::1])", cache=True)
+def _fill_heuristic_row_tables(tables):
+    """Fill the per-row heuristic terms for every 16-bit row."""
+    for row in range(1 << 16):
+        tiles = np.empty(4, dtype=np.int64)
+        for i in range(4):
+            tiles[i] = (row >> (4 * i)) & 0xF
+        empty = 0
+        monotonicity = 0
+        smoothness = 0
+        largest = 0
+        for i in range(4):
+            if tiles[i] == 0:
+                empty += 1
+            largest = max(largest, tiles[i])
+            if i < 3:
+                monotonicity += abs(tiles[i] - tiles[i + 1])
+                if tiles[i] != 0 and tiles[i + 1] != 0:
+                    smoothness += abs((1 << tiles[i]) - (1 << tiles[i + 1]))
+        tables[_ROW_EMPTY, row] = empty
+        tables[_ROW_MONOTONICITY, row] = monotonicity
+        tables[_ROW_SMOOTHNESS, row] = smoothness
+        tables[_ROW_MAX, row] = largest
+
+
+_HEURISTIC_ROW_TABLES = np.zeros((4, 1 << 16), dtype=np.int32)
+_fill_heuristic_row_tables(_HEURISTIC_ROW_TABLES)
+
+
+@njit("float64(uint64, int32[:, ::1], float64, float64, float64, float64)", cache=True)
+def _evaluate_heuristic(state, tables, empty_weight, monotonicity_weight, smoothness_weight, max_tile_weight):
+    """Compiled BaseHeuristicPlayer.evaluate_state: eight row-table lookups on the packed state."""
+    # Columns are scored as the rows of the transposed board; empty cells and the
+    # largest tile only need the rows.
+    transposed = transpose_packed(state)
+    empty_cells = 0
+    max_tile = 0
+    differences = 0
+    value_differences = 0
+    for shift in range(0, 64, 16):
+        row = (state >> np.uint64(shift)) & np.uint64(0xFFFF)
+        column = (transposed >> np.uint64(shift)) & np.uint64(0xFFFF)
+        empty_cells += tables[_ROW_EMPTY, row]
+        max_tile = max(max_tile, tables[_ROW_MAX, row])
+        differences += tables[_ROW_MONOTONICITY, row] + tables[_ROW_MONOTONICITY, column]
+        value_differences += tables[_ROW_SMOOTHNESS, row] + tables[_ROW_SMOOTHNESS, column]
+
+    return (empty_cells * empty_weight +
+            -differences * monotonicity_weight +
+            -value_differences * smoothness_weight +
+            max_tile * max_tile_weight)
+
+def _best_action(valid_actions, evaluate):
+    """Return the first valid action whose next state evaluates highest, like max() with a key."""
+    best_action = valid_actions[0]
+    best_value = evaluate(best_action[1])
+    for action_state_score in valid_actions[1:]:
+        value = evaluate(action_state_score[1])
+        if value > best_value:
+            best_action, best_value = action_state_score, value
+    return best_action
+
+# Spawn sequences less likely than this are scored without searching further.
+_MIN_PROBABILITY = 0.001
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_NIBBLE = np.uint64(0xF)
+
+
+@njit("float64(uint64, int64, float64, boolean, uint32[:, ::1], int32[:, ::1], float64[::1], "
+      "uint64[::1], float64[:, ::1])", cache=True)
+def _expectimax(state, depth, probability, is_chance, move_tables, heuristic_tables, weights,
+                tt_states, tt_entries):
+    """
+    Expectimax value of state. Chance nodes average over every spawn (a 2 with
+    probability 0.9, a 4 with 0.1), max nodes take the best valid move, and leaves and
+    lost boards are scored with _evaluate_heuristic.
+
+    Chance nodes are memoized in a direct-mapped transposition table: tt_states holds
+    the canonical state of each slot (rotations and reflections of a board score the
+    same, so they share an entry) and tt_entries its (searched depth, value); depth 0
+    marks an empty slot. The table length must be a power of two.
+    """
+    if depth <= 0 or (is_chance and probability < _MIN_PROBABILITY):
+        return _evaluate_heuristic(state, heuristic_tables, weights[0], weights[1], weights[2], weights[3])
+
+    # Recursive calls pass "not is_chance" rather than a bool literal: numba would type
+    # a literal as a separate specialization that the on-disk cache cannot resolve.
+    if is_chance:
+        key = canonical_packed(state)
+        slot = ((key * _HASH_MULTIPLIER) >> np.uint64(32)) & np.uint64(tt_states.shape[0] - 1)
+        if tt_entries[slot, 0] >= depth and tt_states[slot] == key:
+            return tt_entries[slot, 1]
+        empty_cells = 0
+        for i in range(16):
+            if (state >> np.uint64(4 * i)) & _NIBBLE == 0:
+                empty_cells += 1
+        if empty_cells == 0:
+            return _evaluate_heuristic(state, heuristic_tables, weights[0], weights[1], weights[2], weights[3])
+
+        probability /= empty_cells
+        total = 0.0
+        for i in range(16):
+            shift = np.uint64(4 * i)
+            if (state >> shift) & _NIBBLE == 0:
+                total += 0.9 * _expectimax(state | (np.uint64(1) << shift), depth - 1, probability * 0.9, not is_chance,
+                                           move_tables, heuristic_tables, weights, tt_states, tt_entries)
+                total += 0.1 * _expectimax(state | (np.uint64(2) << shift), depth - 1, probability * 0.1, not is_chance,
+                                           move_tables, heuristic_tables, weights, tt_states, tt_entries)
+        value = total / empty_cells
+        tt_states[slot] = key
+        tt_entries[slot, 0] = depth
+        tt_entries[slot, 1] = value
+        return value
+
+    best_value = -np.inf
+    moves = simulate_moves_packed(state, move_tables)
+    for action in range(4):
+        next_state = moves[2 * action]
+        if next_state != state:
+            best_value = max(best_value, _expectimax(next_state, depth - 1, probability, not is_chance, move_tables,
+                                                     heuristic_tables, weights, tt_states, tt_entries))
+    if best_value == -np.inf:
+        return _evaluate_heuristic(state, heuristic_tables, weights[0], weights[1], weights[2], weights[3])
+    return best_value
 
 class Player(ABC):
+    # Players that can pick moves for many independent games at once set this to True
+    # and define choose_actions_batch(next_states, valid, rng): next_states and valid
+    # are (N, 4) arrays indexed by Action value, every row has at least one valid
+    # action, and it returns an (N,) array of chosen action indices.
+    supports_batch: bool = False
+    # Players whose choose_action is one of the COMPILED_POLICY_* rules set this to it.
+    compiled_policy: int | None = None
+
     def __init__(self):
         self.name = ""
 
@@ -12,32 +159,70 @@ class Player(ABC):
         """Return a chosen action, the resulting state, and the score for this move."""
         pass
 
+    def reset(self, rng: np.random.Generator | None = None):
+        """
+        Drop any per-game state. Game2048.reset() calls this before every game, with the
+        game's generator for players that make random choices.
+        """
+        pass
+
 class RandomPlayer(Player):
+    supports_batch = True
+    compiled_policy = COMPILED_POLICY_RANDOM
+
     def __init__(self):
         self.name = "Random"
+        self._rng = np.random.default_rng()
+        self._random_buffer: list[float] = []
+
+    def reset(self, rng: np.random.Generator | None = None):
+        # Draws buffered from a previous generator would leak into a reseeded game
+        if rng is not None and rng is not self._rng:
+            self._rng = rng
+            self._random_buffer = []
 
     def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
-        return random.choice(valid_actions)
+        # Uniforms are drawn in bulk, like Game2048's tile spawns; one generator call
+        # per move would cost more than the rest of the move.
+        if not self._random_buffer:
+            self._random_buffer = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+        return valid_actions[int(self._random_buffer.pop() * len(valid_actions))]
+
+    def choose_actions_batch(self, next_states: np.ndarray, valid: np.ndarray,
+                             rng: np.random.Generator) -> np.ndarray:
+        # Invalid actions get weight 0, so the argmax is a uniform pick among valid ones.
+        return (rng.random(valid.shape) * valid).argmax(axis=1)
 
 class MaxEmptyCellsPlayer(Player):
+    supports_batch = True
+    compiled_policy = COMPILED_POLICY_MAX_EMPTY
+
     def __init__(self):
         self.name = "MaxEmptyCells"
 
     def evaluate_state(self, state: int) -> int:
-        return len(Board.get_empty_tiles(state))
+        return Board.count_empty_tiles(state)
 
     def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
-        return max(valid_actions, key=lambda x: self.evaluate_state(x[1]))
+        return _best_action(valid_actions, self.evaluate_state)
+
+    def choose_actions_batch(self, next_states: np.ndarray, valid: np.ndarray,
+                             rng: np.random.Generator) -> np.ndarray:
+        empty_counts = Board.get_empty_nibbles_batch(next_states).sum(axis=-1)
+        # argmax keeps the first maximum, matching max() in choose_action.
+        return np.where(valid, empty_counts, -1).argmax(axis=1)
 
 class MinMaxPlayer(Player):
+    compiled_policy = COMPILED_POLICY_MAX_TILE_SUM
+
     def __init__(self):
         self.name = "MinMax"
 
     def evaluate_state(self, state: int) -> int:
-        return sum([2 ** tile for tile in Board.get_unpacked_state(state) if tile > 0])
+        return Board.get_tile_sum(state)
 
     def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
-        return max(valid_actions, key=lambda x: self.evaluate_state(x[1]))
+        return _best_action(valid_actions, self.evaluate_state)
 
 class BaseHeuristicPlayer(Player):
     """Base class for players that use heuristic evaluation."""
@@ -58,38 +243,30 @@ class BaseHeuristicPlayer(Player):
           - Smoothness: penalize large differences between adjacent tiles.
           - Max tile: reward boards with a high maximum tile.
         """
-        board = Board.get_unpacked_state(state)
-        
-        # Factor 1: Count empty cells.
-        empty_cells = sum(1 for cell in board if cell == 0)
-
-        # Factor 2: Monotonicity
-        row_monotonicity = 0
-        for r in range(4):
-            row = board[r * 4:(r + 1) * 4]
-            row_monotonicity += abs(row[0] - row[1]) + abs(row[1] - row[2]) + abs(row[2] - row[3])
-        col_monotonicity = 0
-        for c in range(4):
-            col = [board[r * 4 + c] for r in range(4)]
-            col_monotonicity += abs(col[0] - col[1]) + abs(col[1] - col[2]) + abs(col[2] - col[3])
-        monotonicity = -(row_monotonicity + col_monotonicity)
-
-        # Factor 3: Smoothness
-        smoothness = 0
-        for r in range(4):
-            for c in range(4):
-                index = r * 4 + c
-                if board[index] != 0:
-                    value = 2 ** board[index]
-                    if c < 3 and board[r * 4 + c + 1] != 0:
-                        neighbor_value = 2 ** board[r * 4 + c + 1]
-                        smoothness -= abs(value - neighbor_value)
-                    if r < 3 and board[(r + 1) * 4 + c] != 0:
-                        neighbor_value = 2 ** board[(r + 1) * 4 + c]
-                        smoothness -= abs(value - neighbor_value)
-
-        # Factor 4: Maximum tile
-        max_tile = max(board)
+        return _evaluate_heuristic(state, _HEURISTIC_ROW_TABLES, self.empty_weight,
+                                   self.monotonicity_weight, self.smoothness_weight,
+                                   self.max_tile_weight)
+
+    def evaluate_states_batch(self, states: np.ndarray) -> np.ndarray:
+        """Same as evaluate_state for every state of an array at once, as float64."""
+        # Nibble order runs bottom-right to top-left, i.e. the board rotated by 180 degrees;
+        # every factor only looks at adjacent pairs, so the scores are unchanged.
+        board = Board.get_nibbles_batch(states).astype(np.int64).reshape(*np.shape(states), 4, 4)
+        occupied = board > 0
+
+        empty_cells = (~occupied).sum(axis=(-2, -1))
+
+        row_diffs = np.abs(np.diff(board, axis=-1)).sum(axis=(-2, -1))
+        col_diffs = np.abs(np.diff(board, axis=-2)).sum(axis=(-2, -1))
+        monotonicity = -(row_diffs + col_diffs)
+
+        values = np.where(occupied, np.left_shift(1, board), 0)
+        row_pairs = occupied[..., :, 1:] & occupied[..., :, :-1]
+        col_pairs = occupied[..., 1:, :] & occupied[..., :-1, :]
+        smoothness = -((np.abs(np.diff(values, axis=-1)) * row_pairs).sum(axis=(-2, -1)) +
+                       (np.abs(np.diff(values, axis=-2)) * col_pairs).sum(axis=(-2, -1)))
+
+        max_tile = board.max(axis=(-2, -1))
 
         return (empty_cells * self.empty_weight +
                 monotonicity * self.monotonicity_weight +
@@ -97,46 +274,138 @@ class BaseHeuristicPlayer(Player):
                 max_tile * self.max_tile_weight)
 
 class HeuristicPlayer(BaseHeuristicPlayer):
+    supports_batch = True
+
     def __init__(self):
         super().__init__(name="Heuristic")
 
+    def choose_actions_batch(self, next_states: np.ndarray, valid: np.ndarray,
+                             rng: np.random.Generator) -> np.ndarray:
+        scores = self.evaluate_states_batch(next_states)
+        # argmax keeps the first maximum, matching max() in choose_action.
+        return np.where(valid, scores, -np.inf).argmax(axis=1)
+
+    def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
+        return _best_action(valid_actions, self.evaluate_state)
+
+class ExpectimaxPlayer(BaseHeuristicPlayer):
+    """
+    Expectimax search over moves and tile spawns, scored with the heuristic at the leaves.
+
+    Python port of the C++ ExpectimaxPlayer; the search itself runs compiled in
+    _expectimax with this player's weights. depth counts plies: every spawn and every
+    move below the root uses one. With a time_limit (seconds per move) the search
+    deepens one ply at a time and plays the best move of the deepest finished pass;
+    the clock is checked between root moves.
+
+    depth_thresholds adapts the depth to the board: it is a sequence of
+    (empty_cells, depth) pairs, and every pair whose empty_cells is at least the empty
+    count after the roomiest move raises the search to its depth. Open boards branch the
+    most and need the search least, while crowded boards are cheap to search and decide
+    the game, so the default ((6, 3), (3, 4)) searches depth plies above 6 empty cells,
+    3 at 6 or fewer and 4 at 3 or fewer. With a time_limit it caps the deepening.
+    """
+    # Slots in the transposition table (a power of two); colliding entries replace each other.
+    TRANSPOSITION_TABLE_SIZE: int = 1 << 18
+
+    def __init__(self, depth: int = 2, time_limit: float | None = None,
+                 depth_thresholds: tuple[tuple[int, int], ...] = ((6, 3), (3, 4))):
+        super().__init__(name="Expectimax")
+        self.depth = depth
+        self.time_limit = time_limit
+        self.depth_thresholds = tuple(depth_thresholds)
+        self._deadline: float | None = None
+        self._timed_out = False
+        # Transposition table for chance nodes: slot -> state and (searched depth, value).
+        # It is kept across moves, since the next move's search revisits this one's
+        # subtrees, and cleared between games so seeded games do not depend on the
+        # games played before them.
+        self._tt_states = np.zeros(self.TRANSPOSITION_TABLE_SIZE, dtype=np.uint64)
+        self._tt_entries = np.zeros((self.TRANSPOSITION_TABLE_SIZE, 2), dtype=np.float64)
+
+    def reset_search(self):
+        """Drop the transposition table, e.g. between games."""
+        self._tt_states.fill(0)
+        self._tt_entries.fill(0)
+
+    def reset(self, rng: np.random.Generator | None = None):
+        self.reset_search()
+
     def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
-        return max(valid_actions, key=lambda action_state_score: self.evaluate_state(action_state_score[1]))
+        # Most empty cells first (stable, so ties keep action order): when time runs
+        # out, the moves searched so far are the likeliest good ones.
+        ordered = sorted(valid_actions, key=lambda action_state_score: Board.count_empty_tiles(action_state_score[1]),
+                         reverse=True)
+        max_depth = self.get_depth(Board.count_empty_tiles(ordered[0][1]))
+        if self.time_limit is None:
+            self._deadline = None
+            return self._search(ordered, max_depth)
+
+        self._deadline = time.perf_counter() + self.time_limit
+        best_action = ordered[0]
+        for depth in range(1, max_depth + 1):
+            self._timed_out = False
+            action = self._search(ordered, depth)
+            if self._timed_out:
+                break
+            best_action = action
+        return best_action
+
+    def get_depth(self, empty_cells: int) -> int:
+        """Search depth for a board with empty_cells empty cells, see depth_thresholds."""
+        depth = self.depth
+        for threshold, threshold_depth in self.depth_thresholds:
+            if empty_cells <= threshold:
+                depth = max(depth, threshold_depth)
+        return depth
+
+    def _search(self, valid_actions, depth):
+        weights = np.array([self.empty_weight, self.monotonicity_weight,
+                            self.smoothness_weight, self.max_tile_weight])
+        move_tables = Board.get_row_tables()
+        best_action, best_value = valid_actions[0], -np.inf
+        for action_state_score in valid_actions:
+            value = _expectimax(action_state_score[1], depth, 1.0, True, move_tables,
+                                _HEURISTIC_ROW_TABLES, weights, self._tt_states, self._tt_entries)
+            if value > best_value:
+                best_action, best_value = action_state_score, value
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                self._timed_out = True
+                break
+        return best_action
 
 class HumanPlayer(Player):
     def __init__(self):
+        # Imported here so only interactive play pays readchar's import time
+        import readchar
+        self._readchar = readchar
         self.name = "Human"
         self._first_move = True
+        # Arrow keys and WASD (either case)
+        self._key_to_action = {
+            readchar.key.LEFT: Action.LEFT, 'a': Action.LEFT, 'A': Action.LEFT,
+            readchar.key.RIGHT: Action.RIGHT, 'd': Action.RIGHT, 'D': Action.RIGHT,
+            readchar.key.UP: Action.UP, 'w': Action.UP, 'W': Action.UP,
+            readchar.key.DOWN: Action.DOWN, 's': Action.DOWN, 'S': Action.DOWN,
+        }
         
     def choose_action(self, valid_actions: list[tuple[Action, int, int]]) -> tuple[Action, int, int]:
-        # Extract just the actions for validation
-        valid_action_types = [action for action, _, _ in valid_actions]
+        # Index the valid moves by action for validation
+        valid_by_action = {action_state_score[0]: action_state_score for action_state_score in valid_actions}
         
         while True:
             try:
                 # Wait for a single keypress without requiring Enter
-                key = readchar.readkey()
+                key = self._readchar.readkey()
                 
-                action = None
-                # Map both arrow keys and WASD to actions
-                if key in [readchar.key.LEFT, 'a', 'A']:
-                    action = Action.LEFT
-                elif key in [readchar.key.RIGHT, 'd', 'D']:
-                    action = Action.RIGHT
-                elif key in [readchar.key.UP, 'w', 'W']:
-                    action = Action.UP
-                elif key in [readchar.key.DOWN, 's', 'S']:
-                    action = Action.DOWN
-                elif key in ['q', 'Q']:  # Allow graceful exit with q
+                if key in ('q', 'Q'):  # Allow graceful exit with q
                     print("\nExiting game. Thanks for playing!")
-                    import sys
                     sys.exit(0)  # Exit cleanly with status code 0
                 
                 # Check if the action is valid
-                if action in valid_action_types:
-                    for act, state, score in valid_actions:
-                        if act == action:
-                            return act, state, score
+                action = self._key_to_action.get(key)
+                if action in valid_by_action:
+                    return valid_by_action[action]
                 elif action is not None:
                     # Only show message for invalid moves (not for unrecognized keys)
                     print("Invalid move!")
@@ -144,7 +413,6 @@ class HumanPlayer(Player):
             except KeyboardInterrupt:
                 # Handle Ctrl+C gracefully
                 print("\nExiting game. Thanks for playing!")
-                import sys
                 sys.exit(0)
 
 # You can add additional player types by inheriting from Player and implementing choose_action.
\ No newline at end of file
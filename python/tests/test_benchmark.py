@@ -1,10 +1,18 @@
+import argparse
+import io
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch, MagicMock
-from src.game2048.benchmark import get_highest_tile, run_benchmark, generate_report
-from src.game2048.board import Board
-from src.game2048.players import RandomPlayer, MaxEmptyCellsPlayer
-from src.game2048.game import Game2048
-from collections import defaultdict
+from game2048.benchmark import (
+    get_highest_tile, run_benchmark, play_parallel, generate_report, save_report, add_arguments, get_player_kwargs,
+    _game_seeds, _grid,
+)
+from game2048.board import Board
+from game2048.players import RandomPlayer, MaxEmptyCellsPlayer, ExpectimaxPlayer
+from game2048.game import Game2048
+import numpy as np
+import os
+import tempfile
 import time
 
 class TestBenchmark(unittest.TestCase):
@@ -27,7 +35,7 @@ class TestBenchmark(unittest.TestCase):
         self.assertEqual(get_highest_tile(0xFFFF_0000_0000_0000), 32768)  # 2^15
 
     @patch('time.time')
-    @patch('src.game2048.game.Game2048.play_game')
+    @patch('game2048.game.Game2048.play_game_fast')
     def test_run_benchmark_basic(self, mock_play_game, mock_time):
         """Test basic benchmark functionality with mocked game play."""
         # Mock time to return increasing values
@@ -58,7 +66,7 @@ class TestBenchmark(unittest.TestCase):
         self.assertEqual(mock_play_game.call_count, 2)
 
     @patch('time.time')
-    @patch('src.game2048.game.Game2048.play_game')
+    @patch('game2048.game.Game2048.play_game_fast')
     def test_run_benchmark_multiple_players(self, mock_play_game, mock_time):
         """Test benchmark with multiple players."""
         # Mock time to return increasing values for each player
@@ -98,12 +106,13 @@ class TestBenchmark(unittest.TestCase):
         self.assertEqual(max_empty_results['avg_moves'], 75)  # (70 + 80) / 2
         self.assertEqual(max_empty_results['time_per_game'], 1.0)  # 2.0 seconds / 2 games
 
-    @patch('src.game2048.interfaces.CLI2048.pretty_print')
-    def test_generate_report(self, mock_pretty_print):
+    @patch('game2048.interfaces.CLI2048.pretty_format', return_value="<board>")
+    def test_generate_report(self, mock_pretty_format):
         """Test report generation with mock benchmark results."""
         # Create mock benchmark results
         mock_results = {
             'Random': {
+                'num_games': 100,
                 'avg_score': 1000.5,
                 'max_score': 2048,
                 'best_state': 0x1234_0000_0000_0000,
@@ -111,12 +120,8 @@ class TestBenchmark(unittest.TestCase):
                 'avg_moves': 150.5,
                 'time_per_game': 0.1,
                 'total_time': 10.0,
-                'highest_tile_counts': defaultdict(int, {
-                    2: 10,
-                    4: 20,
-                    8: 30,
-                    16: 40
-                })
+                # Games per highest tile exponent: 10 x 2, 20 x 4, 30 x 8, 40 x 16
+                'highest_tile_counts': np.array([0, 10, 20, 30, 40] + [0] * 11)
             }
         }
         
@@ -130,15 +135,38 @@ class TestBenchmark(unittest.TestCase):
         self.assertIn('1000.5', report)  # avg_score
         self.assertIn('2048', report)    # max_score
         self.assertIn('150.5', report)   # avg_moves
+        self.assertIn('40 (40.0%)', report)  # tile share of num_games
         
-        # Verify pretty_print was called
-        mock_pretty_print.assert_called_once_with(
+        # Verify the best board was rendered into the report
+        self.assertIn('<board>', report)
+        mock_pretty_format.assert_called_once_with(
             0x1234_0000_0000_0000,  # state
             2048,  # score
             100    # moves
         )
 
-    @patch('src.game2048.game.Game2048.play_game')
+    def test_grid(self):
+        """Test the grid table layout: numeric columns right-aligned, text left-aligned."""
+        table = _grid([["Random", 10, "1.5"], ["MaxEmptyCells", 1000, "12 (3.0%)"]], ["Player", "Games", "2"])
+        self.assertEqual(table, "\n".join([
+            "+---------------+-------+-----------+",
+            "| Player        | Games | 2         |",
+            "+===============+=======+===========+",
+            "| Random        |    10 | 1.5       |",
+            "+---------------+-------+-----------+",
+            "| MaxEmptyCells |  1000 | 12 (3.0%) |",
+            "+---------------+-------+-----------+",
+        ]))
+
+    def test_save_report_streamed(self):
+        """Test that a report given as chunks is written out in order."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "report.html")
+            save_report((chunk for chunk in ["<html>", "<body>", "</html>"]), path, "html")
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "<html><body></html>")
+
+    @patch('game2048.game.Game2048.play_game_fast')
     def test_benchmark_with_optimization(self, mock_play_game):
         """Test that the optimize flag properly handles board optimization."""
         mock_play_game.return_value = (100, 0x1234_0000_0000_0000, 50)
@@ -152,5 +180,111 @@ class TestBenchmark(unittest.TestCase):
         # Both runs should complete without errors
         self.assertEqual(mock_play_game.call_count, 2)
 
+    def test_run_benchmark_without_progress(self):
+        """Test that show_progress=False keeps the benchmark silent."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            run_benchmark(num_games=3, players=[RandomPlayer], show_progress=False, seed=1)
+        self.assertEqual(output.getvalue(), "")
+
+    @patch('game2048.game.Game2048.play_game_fast', autospec=True)
+    def test_player_kwargs(self, mock_play_game):
+        """Test that --depth and --time-limit reach the expectimax players the benchmark builds."""
+        mock_play_game.return_value = (100, 0x1234_0000_0000_0000, 50)
+        parser = argparse.ArgumentParser()
+        add_arguments(parser)
+        player_kwargs = get_player_kwargs(parser.parse_args(["--depth", "1", "--time-limit", "0.5"]))
+        self.assertEqual(player_kwargs[ExpectimaxPlayer], {"depth": 1, "time_limit": 0.5})
+        self.assertEqual(get_player_kwargs(parser.parse_args([]))[ExpectimaxPlayer], {})
+
+        run_benchmark(num_games=1, players=[ExpectimaxPlayer], show_progress=False, player_kwargs=player_kwargs)
+        player = mock_play_game.call_args.args[0].player
+        self.assertEqual((player.depth, player.time_limit), (1, 0.5))
+
+    def test_run_benchmark_no_games(self):
+        """Test that a benchmark of no games is rejected up front."""
+        with self.assertRaises(ValueError):
+            run_benchmark(num_games=0, players=[RandomPlayer], show_progress=False)
+        with self.assertRaises(ValueError):
+            list(play_parallel(RandomPlayer, 0, workers=2))
+
+    @patch('game2048.benchmark.GYM2048.game_finished')
+    @patch('game2048.game.Game2048.play_game_fast')
+    def test_run_benchmark_batched(self, mock_play_game, mock_finished):
+        """Test that batch-capable players skip the per-game loop when batched."""
+        results = run_benchmark(num_games=4, players=[RandomPlayer], optimize=False,
+                                show_progress=False, batched=True)
+        self.assertEqual(mock_play_game.call_count, 0)
+        # Progress still advances once per game
+        self.assertEqual(mock_finished.call_count, 4)
+        # ...with each game's final score
+        finished_scores = [call.args[2] for call in mock_finished.call_args_list]
+        self.assertEqual(max(finished_scores), results['Random']['max_score'])
+        self.assertEqual(results['Random']['highest_tile_counts'].sum(), 4)
+        self.assertGreater(results['Random']['avg_moves'], 0)
+
+    @patch('game2048.benchmark.GYM2048.game_finished')
+    @patch('game2048.game.Game2048.play_game_fast')
+    def test_run_benchmark_compiled(self, mock_play_game, mock_finished):
+        """Test that players with a compiled policy play whole games in compiled code."""
+        first = run_benchmark(num_games=4, players=[MaxEmptyCellsPlayer], show_progress=False,
+                              compiled=True, seed=5)
+        second = run_benchmark(num_games=4, players=[MaxEmptyCellsPlayer], show_progress=False,
+                               compiled=True, seed=5)
+        self.assertEqual(mock_play_game.call_count, 0)
+        # Progress still advances once per game
+        self.assertEqual(mock_finished.call_count, 8)
+        self.assertEqual(first['MaxEmptyCells']['highest_tile_counts'].sum(), 4)
+        self.assertFalse(Board.get_valid_move_actions(first['MaxEmptyCells']['best_state']))
+        for key in ('avg_score', 'max_score', 'best_state', 'avg_moves'):
+            self.assertEqual(first['MaxEmptyCells'][key], second['MaxEmptyCells'][key])
+        np.testing.assert_array_equal(first['MaxEmptyCells']['highest_tile_counts'],
+                                      second['MaxEmptyCells']['highest_tile_counts'])
+
+    def test_run_benchmark_parallel(self):
+        """Test that games spread over worker processes are all accounted for."""
+        results = run_benchmark(num_games=5, players=[RandomPlayer], optimize=True,
+                                show_progress=False, workers=2)
+        player_results = results['Random']
+        self.assertEqual(player_results['highest_tile_counts'].sum(), 5)
+        self.assertGreaterEqual(player_results['max_score'], player_results['avg_score'])
+        self.assertIsNotNone(player_results['best_state'])
+
+    def test_game_seeds(self):
+        """Test that per-game seeds are fixed for a base seed and disjoint across base seeds."""
+        def states(seeds):
+            return [tuple(game_seed.generate_state(2).tolist()) for game_seed in seeds]
+
+        self.assertEqual(states(_game_seeds(100, seed=1)), states(_game_seeds(100, seed=1)))
+        self.assertEqual(len(set(states(_game_seeds(100, seed=1)))), 100)
+        self.assertFalse(set(states(_game_seeds(100, seed=1))) & set(states(_game_seeds(100, seed=2))))
+        self.assertEqual(len(set(states(_game_seeds(100)))), 100)
+
+    def test_run_benchmark_seeded(self):
+        """Test that a seeded benchmark replays the same games with or without workers."""
+        sequential = run_benchmark(num_games=4, players=[RandomPlayer], show_progress=False, seed=11)
+        parallel = run_benchmark(num_games=4, players=[RandomPlayer], show_progress=False, seed=11, workers=2)
+        for key in ('avg_score', 'max_score', 'best_state', 'avg_moves'):
+            self.assertEqual(sequential['Random'][key], parallel['Random'][key])
+        np.testing.assert_array_equal(sequential['Random']['highest_tile_counts'],
+                                      parallel['Random']['highest_tile_counts'])
+
+    @patch('multiprocessing.Pool')
+    @patch('os.cpu_count', return_value=3)
+    def test_run_benchmark_workers_per_cpu(self, mock_cpu_count, mock_pool):
+        """Test that workers=0 queues the games of every player on one pool with a worker per CPU."""
+        chunk = MagicMock()
+        chunk.get.return_value = (0.5, [(100, 0x1234_0000_0000_0000, 50)])
+        mock_pool.return_value.apply_async.return_value = chunk
+        results = run_benchmark(num_games=2, players=[RandomPlayer, MaxEmptyCellsPlayer],
+                                show_progress=False, workers=0)
+        mock_pool.assert_called_once_with(3)
+        submitted = [call.args[1] for call in mock_pool.return_value.apply_async.call_args_list]
+        self.assertEqual([(player_cls, len(seeds)) for player_cls, seeds, *_ in submitted],
+                         [(RandomPlayer, 1), (RandomPlayer, 1), (MaxEmptyCellsPlayer, 1), (MaxEmptyCellsPlayer, 1)])
+        self.assertEqual(results['Random']['avg_score'], 100)
+        self.assertEqual(results['MaxEmptyCells']['total_time'], 1.0)
+        mock_pool.return_value.terminate.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
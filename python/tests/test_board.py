@@ -1,5 +1,6 @@
 import unittest
-from src.game2048.board import Board, Action
+import numpy as np
+from game2048.board import Board, Action, transpose_packed, set_board_mode
 
 class TestBoard(unittest.TestCase):
     def setUp(self):
@@ -85,6 +86,80 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(down_state, 0x0000_0000_0000_1100)  # Should move to bottom
         self.assertEqual(down_score, 0)
 
+    def test_transpose(self):
+        """Test the SWAR board transpose"""
+        # Board state:          Transposed:
+        # 1 2 3 4               1 5 9 D
+        # 5 6 7 8               2 6 A E
+        # 9 A B C               3 7 B F
+        # D E F 0               4 8 C 0
+        state = 0x1234_5678_9ABC_DEF0
+        self.assertEqual(transpose_packed(state), 0x159D_26AE_37BF_48C0)
+        self.assertEqual(transpose_packed(transpose_packed(state)), state)
+
+    def test_canonical(self):
+        """Test that all eight symmetries of a board share one canonical state"""
+        # Board state:          Rotated right:
+        # 1 2 3 4               D 9 5 1
+        # 5 6 7 8               E A 6 2
+        # 9 A B C               F B 7 3
+        # D E F 0               0 C 8 4
+        state = 0x1234_5678_9ABC_DEF0
+        rotated = 0xD951_EA62_FB73_0C84
+        mirrored = 0x4321_8765_CBA9_0FED
+        flipped = 0xDEF0_9ABC_5678_1234
+        canonical = Board.canonical(state)
+        self.assertEqual(canonical, 0x0C84_FB73_EA62_D951)
+        for symmetric in (rotated, mirrored, flipped, transpose_packed(state), transpose_packed(rotated)):
+            self.assertEqual(Board.canonical(symmetric), canonical)
+
+    def test_simulate_vertical_moves(self):
+        """Test UP and DOWN moves on a single column"""
+        # Board state:
+        # 1 0 0 0
+        # 1 0 0 0
+        # 2 0 0 0
+        # 0 0 0 0
+        state = 0x1000_1000_2000_0000
+        moves = Board.simulate_moves(state)
+        self.assertEqual(moves[2], (0x2000_2000_0000_0000, 4))  # UP merges the top pair
+        self.assertEqual(moves[3], (0x0000_0000_2000_2000, 4))  # DOWN merges the top pair too
+
+    def test_simulate_moves_batch(self):
+        """Test that batched simulation matches simulate_moves for every state"""
+        states = [0x1100_0000_0000_0000, 0x1000_1000_2000_0000, 0x1234_5678_9ABC_DEF0, 0]
+        next_states, scores = Board.simulate_moves_batch(np.array(states, dtype=np.uint64))
+        self.assertEqual(next_states.shape, (4, 4))
+        for i, state in enumerate(states):
+            expected = Board.simulate_moves(state)
+            self.assertEqual([(int(s), int(sc)) for s, sc in zip(next_states[i], scores[i])],
+                             list(expected))
+
+    def test_get_empty_nibbles_batch(self):
+        """Test the vectorized empty-cell mask"""
+        empty = Board.get_empty_nibbles_batch(np.array([0x1010_0000_0100_0001], dtype=np.uint64))
+        self.assertEqual(empty.shape, (1, 16))
+        self.assertEqual(int(empty.sum()), 12)
+        self.assertFalse(empty[0, 0])  # Bottom-right tile is set
+        self.assertTrue(empty[0, 1])
+
+    def test_simulate_moves_cached(self):
+        """Test that the cached simulation matches simulate_moves and is bounded"""
+        state = 0x1100_0000_0000_0000
+        self.assertEqual(Board.simulate_moves_cached(state), Board.simulate_moves(state))
+        self.assertIs(Board.simulate_moves_cached(state), Board.simulate_moves_cached(state))
+
+        original_size = Board.SIMULATE_CACHE_SIZE
+        try:
+            Board.reset()
+            Board.SIMULATE_CACHE_SIZE = 2
+            for tile in range(1, 5):
+                Board.simulate_moves_cached(tile << 60)
+            self.assertLessEqual(len(Board._Board__simulate_cache), 2)
+        finally:
+            Board.SIMULATE_CACHE_SIZE = original_size
+            Board.reset()
+
     def test_get_valid_move_actions(self):
         """Test getting valid moves"""
         # Board state:
@@ -126,6 +201,31 @@ class TestBoard(unittest.TestCase):
         
         self.assertEqual(set(empty_cells), expected_empty_cells)
 
+    def test_get_empty_mask(self):
+        """Test the empty-tile bitmask and count"""
+        self.assertEqual(Board.get_empty_mask(0), 0xFFFF)
+        self.assertEqual(Board.get_empty_mask(0xFFFF_FFFF_FFFF_FFFF), 0)
+        # Bit i of the mask tracks the tile at bits 4i..4i+3
+        self.assertEqual(Board.get_empty_mask(0x1010_0000_0100_0001), 0b0101_1111_1011_1110)
+        self.assertEqual(Board.count_empty_tiles(0x1010_0000_0100_0001), 12)
+        self.assertEqual(Board.get_empty_indices(0x1010_0000_0100_0001), (1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 14))
+        self.assertEqual(Board._set_tile_fast(0x1010_0000_0100_0001, 14, 2), 0x1210_0000_0100_0001)
+
+    def test_get_tile_sum(self):
+        """Test the table-based sum of tile values"""
+        self.assertEqual(Board.get_tile_sum(0), 0)
+        self.assertEqual(Board.get_tile_sum(0x1010_0000_0100_0001), 8)
+        for state in (0x0123_4567_89AB_CDEF, 0xFFFF_FFFF_FFFF_FFFF, 0x2100_0030_0004_B000):
+            expected = sum(2**tile for tile in Board.get_unpacked_state(state) if tile > 0)
+            self.assertEqual(Board.get_tile_sum(state), expected)
+
+    def test_get_max_exponent(self):
+        """Test the table-based largest tile exponent"""
+        self.assertEqual(Board.get_max_exponent(0), 0)
+        self.assertEqual(Board.get_max_exponent(0x0000_0000_0000_0001), 1)
+        self.assertEqual(Board.get_max_exponent(0x2100_0030_0004_B000), 11)
+        self.assertEqual(Board.get_max_exponent(0xF000_0000_0000_0000), 15)
+
     def test_set_tile(self):
         """Test setting tile values"""
         state = 0x0000_0000_0000_0000
@@ -155,6 +255,31 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(ValueError):
             Board.set_tile(state, 0, 0, 2)  # Already occupied
 
+    def test_lookup_tables_match_reference(self):
+        """Test the generated row tables against the list-based reference moves"""
+        for row in range(2**16):
+            tiles = [(row >> 12) & 0xF, (row >> 8) & 0xF, (row >> 4) & 0xF, row & 0xF]
+            for reference, table_move in ((Board._move_left_with_score, Board._row_left),
+                                          (Board._move_right_with_score, Board._row_right)):
+                moved, score = reference(tiles)
+                packed = (moved[0] << 12) | (moved[1] << 8) | (moved[2] << 4) | moved[3]
+                self.assertEqual(table_move(row), (packed, score), f"Failed for row {row:04x}")
+
+    def test_board_modes(self):
+        """Test that fast mode skips verification and checked mode restores it"""
+        state = 0x1100_0000_0000_0000
+        expected = Board.simulate_moves(state)
+        try:
+            set_board_mode("fast")
+            self.assertEqual(Board.simulate_moves(state), expected)
+            Board.set_tile(0, 0, 0, 16)  # Fast mode skips the value range check
+        finally:
+            set_board_mode("checked")
+        with self.assertRaises(ValueError):
+            Board.set_tile(0, 0, 0, 16)
+        with self.assertRaises(ValueError):
+            set_board_mode("turbo")
+
     def test_edge_cases(self):
         """Test edge cases and special scenarios"""
         # Test merging maximum values (15)
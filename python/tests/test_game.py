@@ -1,8 +1,12 @@
+import io
+import random
 import unittest
-from src.game2048.game import Game2048
-from src.game2048.board import Board
-from src.game2048.players import RandomPlayer
-from src.game2048.interfaces import GYM2048
+from contextlib import redirect_stdout
+import numpy as np
+from game2048.game import Game2048, play_games_batched
+from game2048.board import Board
+from game2048.players import RandomPlayer, MaxEmptyCellsPlayer, MinMaxPlayer, HeuristicPlayer, ExpectimaxPlayer
+from game2048.interfaces import GYM2048, CLI2048, CLEAR_SCREEN
 
 class TestGame2048(unittest.TestCase):
     def setUp(self):
@@ -36,6 +40,17 @@ class TestGame2048(unittest.TestCase):
         new_empty_tiles = len(Board.get_empty_tiles(self.game.board.get_state()))
         self.assertEqual(initial_empty_tiles - 1, new_empty_tiles)
 
+    def test_add_random_tile_seeded(self):
+        """Test that tile spawns are reproducible from the game's rng."""
+        states = []
+        for _ in range(2):
+            game = Game2048(rng=np.random.default_rng(7))
+            for _ in range(10):
+                game.add_random_tile()
+            states.append(game.board.get_state())
+        self.assertEqual(states[0], states[1])
+        self.assertEqual(Board.count_empty_tiles(states[0]), 4)
+
     def test_reset(self):
         """Test game reset functionality."""
         # Play some moves to change the game state
@@ -76,6 +91,23 @@ class TestGame2048(unittest.TestCase):
         valid_actions = Board.get_valid_move_actions(final_state)
         self.assertEqual(len(valid_actions), 0)
 
+    def test_play_game_fast(self):
+        """Test that the benchmark game loop plays the same game as play_game."""
+        results = []
+        for play in ("play_game", "play_game_fast"):
+            game = Game2048(player=RandomPlayer(), rng=np.random.default_rng(3))
+            results.append(getattr(game, play)())
+            self.assertEqual(game.board.get_state(), results[-1][1])
+            self.assertEqual(game.get_score(), results[-1][0])
+        self.assertEqual(results[0], results[1])
+
+    def test_seed_keeps_global_random(self):
+        """Test that seeded games replay without touching the global random module."""
+        random_state = random.getstate()
+        results = [Game2048(player=RandomPlayer()).play_game_fast(seed=5) for _ in range(2)]
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(random.getstate(), random_state)
+
     def test_get_score(self):
         """Test score tracking."""
         self.game.reset()
@@ -87,5 +119,100 @@ class TestGame2048(unittest.TestCase):
         new_score = self.game.get_score()
         self.assertGreaterEqual(new_score, initial_score)
 
+    def test_play_games_batched(self):
+        """Test that batched games all run to a terminal state."""
+        for player in (RandomPlayer(), MaxEmptyCellsPlayer(), HeuristicPlayer()):
+            scores, states, move_counts = play_games_batched(player, 8, np.random.default_rng(0))
+            self.assertEqual(len(scores), 8)
+            for state, move_count in zip(states.tolist(), move_counts.tolist()):
+                self.assertEqual(len(Board.get_valid_move_actions(state)), 0)
+                self.assertGreater(move_count, 0)
+        self.assertFalse(hasattr(MinMaxPlayer(), 'choose_actions_batch'))
+        with self.assertRaises(ValueError):
+            play_games_batched(MinMaxPlayer(), 8)
+
+    def test_gym_counts_finished_games(self):
+        """Test that GYM counts every game once, when it ends, with its final score."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            interface = GYM2048()
+            interface.set_total_games(2)
+            game = Game2048(player=RandomPlayer(), interface=interface)
+            scores = [game.play_game(seed=1)[0], game.play_game_fast(seed=2)[0]]
+        self.assertEqual(interface.current_game, 2)
+        self.assertEqual(interface.best_score, max(scores))
+        self.assertIn("(2/2 games)", output.getvalue())
+
+    def test_pretty_print_redirected(self):
+        """Test that the screen is not cleared when output is not a terminal."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            CLI2048.pretty_print(0x1100_0000_0000_0000, 4, 1)
+        self.assertNotIn(CLEAR_SCREEN, output.getvalue())
+        self.assertEqual(output.getvalue(), CLI2048.pretty_format(0x1100_0000_0000_0000, 4, 1) + "\n")
+
+    def test_heuristic_evaluate_state(self):
+        """Test the compiled heuristic against hand-computed scores."""
+        player = HeuristicPlayer()
+        # 14 empty * 270 - 3 monotonicity * 470 + 0 smoothness + max exponent 1 * 100
+        self.assertEqual(player.evaluate_state(0x1100_0000_0000_0000), 2470.0)
+        # 14 * 270 - 6 * 470 - |2 - 4| * 15 + 2 * 100
+        self.assertEqual(player.evaluate_state(0x1200_0000_0000_0000), 1130.0)
+        # Full board of equal tiles: nothing empty, flat and smooth
+        self.assertEqual(player.evaluate_state(0xFFFF_FFFF_FFFF_FFFF), 1500.0)
+
+    def test_evaluate_states_batch(self):
+        """Test that the vectorized heuristic scores match evaluate_state."""
+        player = HeuristicPlayer()
+        rng = random.Random(3)
+        states = [0, 0x1234_5678_9ABC_DEF1] + [rng.getrandbits(64) & rng.getrandbits(64) for _ in range(50)]
+        batch_scores = player.evaluate_states_batch(np.array(states, dtype=np.uint64))
+        self.assertEqual(batch_scores.tolist(), [player.evaluate_state(state) for state in states])
+
+    def test_expectimax_player(self):
+        """Test that expectimax plays valid moves to the end and honors a time limit."""
+        game = Game2048(player=ExpectimaxPlayer(depth=1))
+        score, state, move_count = game.play_game_fast(seed=2)
+        self.assertEqual(len(Board.get_valid_move_actions(state)), 0)
+        self.assertGreater(move_count, 0)
+
+        valid_actions = Board.get_valid_move_actions(0x1100_2200_0000_0000)
+        for player in (ExpectimaxPlayer(depth=3), ExpectimaxPlayer(depth=8, time_limit=0.01)):
+            self.assertIn(player.choose_action(valid_actions), valid_actions)
+
+    def test_expectimax_transposition_table(self):
+        """Test that searched chance nodes are stored with their depth and can be dropped."""
+        player = ExpectimaxPlayer(depth=3)
+        valid_actions = Board.get_valid_move_actions(0x1100_2200_0000_0000)
+        first = player.choose_action(valid_actions)
+        stored_depths = set(player._tt_entries[:, 0].tolist()) - {0.0}
+        self.assertEqual(stored_depths, {1.0, 3.0})
+        # A second search is answered from the table without changing its choice
+        self.assertEqual(player.choose_action(valid_actions), first)
+        player.reset_search()
+        self.assertFalse(player._tt_entries.any())
+
+    def test_expectimax_reset_between_games(self):
+        """Test that a reused player replays a seeded game exactly like a fresh one."""
+        reused = Game2048(player=ExpectimaxPlayer(depth=4))
+        reused_results = [reused.play_game_fast(seed=seed) for seed in (1, 2, 3)]
+        fresh_results = [Game2048(player=ExpectimaxPlayer(depth=4)).play_game_fast(seed=seed) for seed in (1, 2, 3)]
+        self.assertEqual(reused_results, fresh_results)
+
+    def test_expectimax_depth_thresholds(self):
+        """Test that crowded boards are searched deeper than open ones."""
+        player = ExpectimaxPlayer()
+        self.assertEqual([player.get_depth(empty) for empty in (14, 7, 6, 4, 3, 0)], [2, 2, 3, 3, 4, 4])
+        # Thresholds only ever deepen the search
+        self.assertEqual(ExpectimaxPlayer(depth=5).get_depth(0), 5)
+        self.assertEqual(ExpectimaxPlayer(depth_thresholds=()).get_depth(0), 2)
+        # Every move from 0x1100_2200_0000_0000 leaves over 6 empty cells: a 2-ply search
+        player.choose_action(Board.get_valid_move_actions(0x1100_2200_0000_0000))
+        self.assertEqual(max(player._tt_entries[:, 0].tolist()), 2.0)
+        # Every move from 0x1234_5678_9ABC_1200 leaves 2 empty cells: a 4-ply search
+        player.reset_search()
+        player.choose_action(Board.get_valid_move_actions(0x1234_5678_9ABC_1200))
+        self.assertEqual(max(player._tt_entries[:, 0].tolist()), 4.0)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file